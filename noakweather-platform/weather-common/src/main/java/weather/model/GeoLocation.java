@@ -35,6 +35,12 @@ public record GeoLocation(
     Integer elevationMeters
 ) {
     
+    /** Mean Earth radius in kilometers (Haversine distance) */
+    private static final double EARTH_RADIUS_KM = 6371.0;
+    
+    /** Meters per international foot */
+    private static final double METERS_PER_FOOT = 0.3048;
+    
     /**
      * Compact constructor with validation
      */
@@ -56,7 +62,7 @@ public record GeoLocation(
      */
     public static GeoLocation fromFeet(double latitude, double longitude, Integer elevationFeet) {
         Integer elevationMeters = elevationFeet != null 
-            ? (int) Math.round(elevationFeet * 0.3048) 
+            ? (int) Math.round(elevationFeet * METERS_PER_FOOT) 
             : null;
         return new GeoLocation(latitude, longitude, elevationMeters);
     }
@@ -80,7 +86,7 @@ public record GeoLocation(
      */
     public Integer elevationFeet() {
         return elevationMeters != null 
-            ? (int) Math.round(elevationMeters / 0.3048) 
+            ? (int) Math.round(elevationMeters / METERS_PER_FOOT) 
             : null;
     }
     
@@ -89,16 +95,16 @@ public record GeoLocation(
      * @return distance in kilometers
      */
     public double distanceTo(GeoLocation other) {
-        final double EARTH_RADIUS_KM = 6371.0;
+        double lat1Rad = Math.toRadians(latitude);
+        double lat2Rad = Math.toRadians(other.latitude);
         
-        double lat1Rad = Math.toRadians(this.latitude());
-        double lat2Rad = Math.toRadians(other.latitude());
-        double deltaLat = Math.toRadians(other.latitude() - this.latitude());
-        double deltaLon = Math.toRadians(other.longitude() - this.longitude());
+        // Each half-angle sine is squared, so evaluate it once
+        double sinHalfDeltaLat = Math.sin(Math.toRadians(other.latitude - latitude) / 2);
+        double sinHalfDeltaLon = Math.sin(Math.toRadians(other.longitude - longitude) / 2);
         
-        double a = Math.sin(deltaLat / 2) * Math.sin(deltaLat / 2) +
+        double a = sinHalfDeltaLat * sinHalfDeltaLat +
                    Math.cos(lat1Rad) * Math.cos(lat2Rad) *
-                   Math.sin(deltaLon / 2) * Math.sin(deltaLon / 2);
+                   sinHalfDeltaLon * sinHalfDeltaLon;
         
         double c = 2 * Math.atan2(Math.sqrt(a), Math.sqrt(1 - a));
         
@@ -19,10 +19,14 @@ package weather.model;
 import com.fasterxml.jackson.annotation.JsonTypeName;
 import weather.model.components.ForecastPeriod;
 import weather.model.components.ValidityPeriod;
+import weather.model.enums.ChangeIndicator;
 
 import java.time.Instant;
 import java.util.ArrayList;
+import java.util.Collections;
+import java.util.EnumMap;
 import java.util.List;
+import java.util.Map;
 import java.util.Objects;
 
 /**
@@ -83,6 +87,12 @@ public class NoaaTafData extends NoaaWeatherData {
      */
     private List<ForecastPeriod> forecastPeriods;
 
+    /**
+     * Forecast periods indexed by change indicator, built on first query and
+     * discarded whenever the period list changes. Transient so it is never serialized.
+     */
+    private transient Map<ChangeIndicator, List<ForecastPeriod>> periodsByIndicator;
+
     /**
      * Maximum temperature forecast (Celsius).
      * From TAF temperature group: TX15/1518Z
@@ -155,6 +165,7 @@ public class NoaaTafData extends NoaaWeatherData {
 
     public void setForecastPeriods(List<ForecastPeriod> forecastPeriods) {
         this.forecastPeriods = forecastPeriods != null ? new ArrayList<>(forecastPeriods) : new ArrayList<>();
+        this.periodsByIndicator = null;
     }
 
     /**
@@ -165,6 +176,7 @@ public class NoaaTafData extends NoaaWeatherData {
     public void addForecastPeriod(ForecastPeriod period) {
         if (period != null) {
             this.forecastPeriods.add(period);
+            this.periodsByIndicator = null;
         }
     }
 
@@ -230,10 +242,8 @@ public class NoaaTafData extends NoaaWeatherData {
      * @return the BASE forecast period, or null if not found
      */
     public ForecastPeriod getBaseForecast() {
-        return forecastPeriods.stream()
-                .filter(ForecastPeriod::isBaseForecast)
-                .findFirst()
-                .orElse(null);
+        List<ForecastPeriod> base = getPeriods(ChangeIndicator.BASE);
+        return base.isEmpty() ? null : base.get(0);
     }
 
     /**
@@ -242,9 +252,7 @@ public class NoaaTafData extends NoaaWeatherData {
      * @return list of FM periods
      */
     public List<ForecastPeriod> getFromPeriods() {
-        return forecastPeriods.stream()
-                .filter(p -> p.changeIndicator() == weather.model.enums.ChangeIndicator.FM)
-                .toList();
+        return getPeriods(ChangeIndicator.FM);
     }
 
     /**
@@ -253,9 +261,7 @@ public class NoaaTafData extends NoaaWeatherData {
      * @return list of TEMPO periods
      */
     public List<ForecastPeriod> getTempoPeriods() {
-        return forecastPeriods.stream()
-                .filter(p -> p.changeIndicator() == weather.model.enums.ChangeIndicator.TEMPO)
-                .toList();
+        return getPeriods(ChangeIndicator.TEMPO);
     }
 
     /**
@@ -264,9 +270,7 @@ public class NoaaTafData extends NoaaWeatherData {
      * @return list of BECMG periods
      */
     public List<ForecastPeriod> getBecomingPeriods() {
-        return forecastPeriods.stream()
-                .filter(p -> p.changeIndicator() == weather.model.enums.ChangeIndicator.BECMG)
-                .toList();
+        return getPeriods(ChangeIndicator.BECMG);
     }
 
     /**
@@ -275,9 +279,39 @@ public class NoaaTafData extends NoaaWeatherData {
      * @return list of PROB periods
      */
     public List<ForecastPeriod> getProbabilityPeriods() {
-        return forecastPeriods.stream()
-                .filter(p -> p.changeIndicator() == weather.model.enums.ChangeIndicator.PROB)
-                .toList();
+        return getPeriods(ChangeIndicator.PROB);
+    }
+
+    /**
+     * Group all forecast periods by change indicator.
+     * <p>
+     * The grouping is built in a single pass on first use and reused until a
+     * period is added or the list is replaced, so the per-indicator getters and
+     * {@link #getBaseForecast()} are served from it without rescanning.
+     *
+     * @return map from change indicator to its periods in report order;
+     *         indicators without periods are absent
+     */
+    public Map<ChangeIndicator, List<ForecastPeriod>> getPeriodsByChangeIndicator() {
+        if (periodsByIndicator == null) {
+            Map<ChangeIndicator, List<ForecastPeriod>> grouped = new EnumMap<>(ChangeIndicator.class);
+            for (ForecastPeriod period : forecastPeriods) {
+                grouped.computeIfAbsent(period.changeIndicator(), k -> new ArrayList<>()).add(period);
+            }
+            grouped.replaceAll((indicator, periods) -> Collections.unmodifiableList(periods));
+            periodsByIndicator = Collections.unmodifiableMap(grouped);
+        }
+        return periodsByIndicator;
+    }
+
+    /**
+     * Get the periods for a single change indicator.
+     *
+     * @param indicator the change indicator to select
+     * @return immutable list of matching periods in report order
+     */
+    private List<ForecastPeriod> getPeriods(ChangeIndicator indicator) {
+        return getPeriodsByChangeIndicator().getOrDefault(indicator, List.of());
     }
 
     /**
@@ -286,10 +320,14 @@ public class NoaaTafData extends NoaaWeatherData {
      * @return the active forecast period, or null if none active
      */
     public ForecastPeriod getCurrentForecastPeriod() {
-        return forecastPeriods.stream()
-                .filter(ForecastPeriod::isCurrentlyActive)
-                .findFirst()
-                .orElse(null);
+        // Read the clock once for the whole scan instead of once per period
+        Instant now = Instant.now();
+        for (ForecastPeriod period : forecastPeriods) {
+            if (period.contains(now)) {
+                return period;
+            }
+        }
+        return null;
     }
 
     /**
@@ -25,6 +25,7 @@ import java.time.Instant;
 import java.util.ArrayList;
 import java.util.List;
 import java.util.Objects;
+import java.util.OptionalInt;
 
 /**
  * Platform-native NOAA weather data implementation.
@@ -71,6 +72,12 @@ public non-sealed class NoaaWeatherData extends WeatherData {
      */
     private List<RunwayVisualRange> runwayVisualRange;
 
+    /**
+     * Shared empty runway visual range list. Most reports carry no RVR groups, so the
+     * mutable list is only allocated on the first {@link #addRunwayVisualRange}.
+     */
+    private static final List<RunwayVisualRange> NO_RUNWAY_VISUAL_RANGE = List.of();
+
     /**
      * Raw text of the weather report as received from NOAA
      */
@@ -112,14 +119,14 @@ public non-sealed class NoaaWeatherData extends WeatherData {
     public NoaaWeatherData() {
         super();
         this.conditions = WeatherConditions.empty();
-        this.runwayVisualRange = new ArrayList<>();
+        this.runwayVisualRange = NO_RUNWAY_VISUAL_RANGE;
     }
 
     public NoaaWeatherData(String stationId, Instant observationTime, String reportType) {
         super(WeatherDataSource.NOAA, stationId, observationTime);
         this.reportType = reportType;
         this.conditions = WeatherConditions.empty();
-        this.runwayVisualRange = new ArrayList<>();
+        this.runwayVisualRange = NO_RUNWAY_VISUAL_RANGE;
     }
 
     // ========== CONDITIONS GETTER/SETTER ==========
@@ -201,8 +208,9 @@ public non-sealed class NoaaWeatherData extends WeatherData {
      * @return immutable list of sky conditions, empty list if no conditions
      */
     public List<SkyCondition> getSkyConditions() {
+        // WeatherConditions already holds an immutable copy, so no further copy is needed
         return conditions != null && conditions.skyConditions() != null
-                ? List.copyOf(conditions.skyConditions())
+                ? conditions.skyConditions()
                 : List.of();
     }
 
@@ -238,6 +246,7 @@ public non-sealed class NoaaWeatherData extends WeatherData {
 
     /**
      * Get runway visual range as an immutable copy.
+     * Copying the shared empty list returns it as-is, so reports without RVR do not allocate.
      *
      * @return immutable copy of runway visual range list
      */
@@ -246,11 +255,14 @@ public non-sealed class NoaaWeatherData extends WeatherData {
     }
 
     public void setRunwayVisualRange(List<RunwayVisualRange> runwayVisualRange) {
-        this.runwayVisualRange = runwayVisualRange != null ? runwayVisualRange : new ArrayList<>();
+        this.runwayVisualRange = runwayVisualRange != null ? runwayVisualRange : NO_RUNWAY_VISUAL_RANGE;
     }
 
     public void addRunwayVisualRange(RunwayVisualRange rvr) {
         if (rvr != null) {
+            if (this.runwayVisualRange == NO_RUNWAY_VISUAL_RANGE) {
+                this.runwayVisualRange = new ArrayList<>();
+            }
             this.runwayVisualRange.add(rvr);
         }
     }
@@ -349,12 +361,14 @@ public non-sealed class NoaaWeatherData extends WeatherData {
             return null;
         }
 
-        return runwayVisualRange.stream()
+        // Reduce on an IntStream rather than comparing boxed Integers
+        OptionalInt minimum = runwayVisualRange.stream()
                 .filter(r -> !r.isLessThan()) // Exclude "less than" values for conservative estimate
                 .map(r -> r.isVariable() ? r.variableLow() : r.visualRangeFeet())
                 .filter(Objects::nonNull)
-                .min(Integer::compareTo)
-                .orElse(null);
+                .mapToInt(Integer::intValue)
+                .min();
+        return minimum.isPresent() ? minimum.getAsInt() : null;
     }
 
     /**
@@ -74,6 +74,16 @@ public record WeatherConditions(
         Pressure pressure
 ) {
 
+    /** Sentinel for "no ceiling layer" in primitive ceiling scans */
+    private static final int NO_CEILING = Integer.MAX_VALUE;
+
+    /**
+     * Shared empty conditions. Every new NoaaWeatherData starts from empty conditions,
+     * and the record is immutable, so a single instance serves as the default.
+     */
+    private static final WeatherConditions EMPTY =
+            new WeatherConditions(null, null, List.of(), List.of(), null, null);
+
     /**
      * Compact constructor with defensive copying and null safety.
      * Ensures lists are immutable and never null.
@@ -133,12 +143,25 @@ public record WeatherConditions(
      * @return ceiling height in feet, or null if no ceiling
      */
     public Integer getCeilingFeet() {
-        return skyConditions.stream()
-                .filter(SkyCondition::isCeiling)
-                .map(SkyCondition::heightFeet)
-                .filter(java.util.Objects::nonNull)
-                .min(Integer::compareTo)
-                .orElse(null);
+        int ceiling = lowestCeilingFeet();
+        return ceiling != NO_CEILING ? ceiling : null;
+    }
+
+    /**
+     * Find the lowest BKN/OVC layer height with a primitive scan, so the
+     * per-period IMC check avoids a boxed stream pipeline.
+     *
+     * @return lowest ceiling height in feet, or {@link #NO_CEILING} if none
+     */
+    private int lowestCeilingFeet() {
+        int lowest = NO_CEILING;
+        for (SkyCondition layer : skyConditions) {
+            Integer height = layer.heightFeet();
+            if (height != null && height < lowest && layer.isCeiling()) {
+                lowest = height;
+            }
+        }
+        return lowest;
     }
 
     /**
@@ -161,6 +184,22 @@ public record WeatherConditions(
                 .anyMatch(PresentWeather::isThunderstorm);
     }
 
+    /**
+     * Check if precipitation or thunderstorms are present.
+     * Equivalent to {@code hasPrecipitation() || hasThunderstorms()} in a single
+     * pass that stops at the first matching phenomenon.
+     *
+     * @return true if any present weather includes precipitation or a thunderstorm
+     */
+    public boolean hasPrecipitationOrThunderstorms() {
+        for (PresentWeather weather : presentWeather) {
+            if (weather.hasPrecipitation() || weather.isThunderstorm()) {
+                return true;
+            }
+        }
+        return false;
+    }
+
     /**
      * Check if freezing conditions exist (based on temperature or weather).
      *
@@ -197,8 +236,7 @@ public record WeatherConditions(
         }
 
         // Check ceiling - less than 1000 feet
-        Integer ceiling = getCeilingFeet();
-        return ceiling != null && ceiling < 1000;
+        return lowestCeilingFeet() < 1000;
     }
 
     /**
@@ -267,7 +305,7 @@ public record WeatherConditions(
      * @return empty WeatherConditions
      */
     public static WeatherConditions empty() {
-        return new WeatherConditions(null, null, List.of(), List.of(), null, null);
+        return EMPTY;
     }
 
     /**
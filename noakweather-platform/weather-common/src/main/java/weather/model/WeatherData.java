@@ -58,7 +58,8 @@ public abstract sealed class WeatherData
 
     /**
      * Unique identifier for this weather data record.
-     * Generated at ingestion time, never changes.
+     * Generated at ingestion time, never changes. Always a canonical
+     * (dashed, 36-character) version 4 UUID string.
      */
     private final String id;
 
@@ -23,6 +23,7 @@ import java.time.Duration;
 import java.time.Instant;
 import java.time.ZoneOffset;
 import java.time.format.DateTimeFormatter;
+import java.util.Set;
 
 /**
  * Immutable value object representing a single forecast period within a TAF.
@@ -79,15 +80,23 @@ public record ForecastPeriod(
 ) {
 
     /**
-     * Valid probability values for PROB forecasts.
+     * Valid probability values for PROB forecasts (hashed lookup, checked on every construction).
      */
-    private static final int[] VALID_PROBABILITIES = {30, 40};
+    private static final Set<Integer> VALID_PROBABILITIES = Set.of(30, 40);
 
     /**
      * Maximum reasonable forecast period duration in hours.
      */
     private static final int MAX_PERIOD_HOURS = 12;
 
+    /** TAF change-time formatter (DDHHmm, UTC) - formatters are immutable and thread-safe, so build once */
+    private static final DateTimeFormatter TAF_TIME_FORMAT = DateTimeFormatter.ofPattern("ddHHmm")
+            .withZone(ZoneOffset.UTC);
+
+    /** TAF period formatter (DDHH, UTC) */
+    private static final DateTimeFormatter TAF_PERIOD_FORMAT = DateTimeFormatter.ofPattern("ddHH")
+            .withZone(ZoneOffset.UTC);
+
     /**
      * Compact constructor with validation.
      */
@@ -192,14 +201,7 @@ public record ForecastPeriod(
             if (probability == null) {
                 throw new IllegalArgumentException("PROB forecast must have probability value");
             }
-            boolean valid = false;
-            for (int validProb : VALID_PROBABILITIES) {
-                if (probability == validProb) {
-                    valid = true;
-                    break;
-                }
-            }
-            if (!valid) {
+            if (!VALID_PROBABILITIES.contains(probability)) {
                 throw new IllegalArgumentException(
                         "Invalid probability: " + probability + ". Must be 30 or 40"
                 );
@@ -370,8 +372,8 @@ public record ForecastPeriod(
             return false;
         }
 
-        return conditions.hasPrecipitation()
-                || conditions.hasThunderstorms()
+        // Present-weather checks share one scan; IMC (which scans sky layers) only runs if it finds nothing
+        return conditions.hasPrecipitationOrThunderstorms()
                 || conditions.isLikelyIMC();
     }
 
@@ -390,11 +392,6 @@ public record ForecastPeriod(
      * @return TAF formatted string
      */
     public String toTafFormat() {
-        DateTimeFormatter timeFormatter = DateTimeFormatter.ofPattern("ddHHmm")
-                .withZone(ZoneOffset.UTC);
-        DateTimeFormatter periodFormatter = DateTimeFormatter.ofPattern("ddHH")
-                .withZone(ZoneOffset.UTC);
-
         StringBuilder sb = new StringBuilder();
 
         switch (changeIndicator) {
@@ -402,35 +399,35 @@ public record ForecastPeriod(
                 sb.append("BASE");
                 if (periodStart != null && periodEnd != null) {
                     sb.append(" ")
-                            .append(periodFormatter.format(periodStart))
+                            .append(TAF_PERIOD_FORMAT.format(periodStart))
                             .append("/")
-                            .append(periodFormatter.format(periodEnd));
+                            .append(TAF_PERIOD_FORMAT.format(periodEnd));
                 }
                 break;
 
             case FM:
-                sb.append("FM").append(timeFormatter.format(changeTime));
+                sb.append("FM").append(TAF_TIME_FORMAT.format(changeTime));
                 break;
 
             case TEMPO:
                 sb.append("TEMPO ")
-                        .append(periodFormatter.format(periodStart))
+                        .append(TAF_PERIOD_FORMAT.format(periodStart))
                         .append("/")
-                        .append(periodFormatter.format(periodEnd));
+                        .append(TAF_PERIOD_FORMAT.format(periodEnd));
                 break;
 
             case BECMG:
                 sb.append("BECMG ")
-                        .append(periodFormatter.format(periodStart))
+                        .append(TAF_PERIOD_FORMAT.format(periodStart))
                         .append("/")
-                        .append(periodFormatter.format(periodEnd));
+                        .append(TAF_PERIOD_FORMAT.format(periodEnd));
                 break;
 
             case PROB:
                 sb.append("PROB").append(probability).append(" ")
-                        .append(periodFormatter.format(periodStart))
+                        .append(TAF_PERIOD_FORMAT.format(periodStart))
                         .append("/")
-                        .append(periodFormatter.format(periodEnd));
+                        .append(TAF_PERIOD_FORMAT.format(periodEnd));
                 break;
         }
 
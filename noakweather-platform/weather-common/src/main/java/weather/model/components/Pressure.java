@@ -16,6 +16,8 @@
  */
 package weather.model.components;
 
+import java.util.Arrays;
+
 import weather.model.enums.PressureUnit;
 
 /**
@@ -77,6 +79,51 @@ public record Pressure(
     /** Rapid pressure change threshold in hPa/3hrs (meteorological significance) */
     public static final double RAPID_PRESSURE_CHANGE_HPA = 6.0;
     
+    /** Tendency band lower bounds in hPa, ascending (exclusive - a value on a bound falls below it) */
+    private static final double[] TENDENCY_THRESHOLDS_HPA = {-3.0, -1.0, 1.0, 3.0};
+    
+    /** Tendency descriptions, one per band delimited by {@link #TENDENCY_THRESHOLDS_HPA} */
+    private static final String[] TENDENCY_DESCRIPTIONS = {
+        "Rapidly falling", "Falling", "Steady", "Rising", "Rapidly rising"
+    };
+    
+    /**
+     * Base condition band lower bounds in hPa, ascending (inclusive). The top bound is the
+     * next double above 1030 so that exactly 1030 hPa still reads as generally fair.
+     */
+    private static final double[] BASE_CONDITION_THRESHOLDS_HPA = {980.0, 1000.0, Math.nextUp(1030.0)};
+    
+    /** Base weather conditions, one per band delimited by {@link #BASE_CONDITION_THRESHOLDS_HPA} */
+    private static final String[] BASE_CONDITIONS = {
+        "Stormy conditions likely",
+        "Unsettled weather likely",
+        "Generally fair conditions",
+        "Fair weather likely"
+    };
+    
+    /** Condition text when the tendency stays inside its pressure band's stable range */
+    private static final String STABLE_CONDITION = "Weather conditions stable";
+    
+    /**
+     * Stable tendency range in hPa per pressure band (low, normal, high). A tendency
+     * strictly below the first bound is falling, strictly above the second is rising.
+     */
+    private static final double[][] STABLE_TENDENCY_RANGES_HPA = {
+        {-2.0, 2.0},
+        {-3.0, 3.0},
+        {-1.0, 1.0}
+    };
+    
+    /** Condition text per pressure band (low, normal, high) and tendency (falling, stable, rising) */
+    private static final String[][] CONDITIONS_BY_BAND = {
+        {"Deteriorating weather, storm approaching", STABLE_CONDITION, "Improving weather, storm clearing"},
+        {"Weather deteriorating", STABLE_CONDITION, "Weather improving"},
+        {"Fair weather, may deteriorate", STABLE_CONDITION, "Fair weather, becoming more settled"}
+    };
+    
+    /** Shared standard sea level pressure instance - records are immutable, so one instance is reused */
+    private static final Pressure STANDARD = new Pressure(STANDARD_PRESSURE_HPA, PressureUnit.HECTOPASCALS);
+    
     // ==================== Compact Constructor ====================
     
     /**
@@ -315,17 +362,12 @@ public record Pressure(
     public String getPressureTendencyDescription(Pressure previousPressure) {
         double tendency = getPressureTendency(previousPressure);
         
-        if (tendency > 3.0) {
-            return "Rapidly rising";
-        } else if (tendency > 1.0) {
-            return "Rising";
-        } else if (tendency > -1.0) {
-            return "Steady";
-        } else if (tendency > -3.0) {
-            return "Falling";
-        } else {
-            return "Rapidly falling";
+        // Band index = number of thresholds strictly below the tendency
+        int index = Arrays.binarySearch(TENDENCY_THRESHOLDS_HPA, tendency);
+        if (index < 0) {
+            index = -index - 1;
         }
+        return TENDENCY_DESCRIPTIONS[index];
     }
     
     /**
@@ -343,62 +385,39 @@ public record Pressure(
     }
     
     private String getBaseWeatherCondition() {
-        double pressureHpa = toHectopascals();
-
-        // Base assessment only on current pressure
-        if (pressureHpa < 980.0) {
-            return "Stormy conditions likely";
-        } else if (pressureHpa < 1000.0) {
-            return "Unsettled weather likely";
-        } else if (pressureHpa > 1030.0) {
-            return "Fair weather likely";
-        } else {
-            return "Generally fair conditions";
-        }
+        // Base assessment only on current pressure.
+        // Band index = number of thresholds at or below the pressure
+        int index = Arrays.binarySearch(BASE_CONDITION_THRESHOLDS_HPA, toHectopascals());
+        index = index >= 0 ? index + 1 : -index - 1;
+        return BASE_CONDITIONS[index];
     }
     
     private String getWeatherConditionWithTendency(Pressure previousPressure) {
+        // Convert once and derive the tendency from the same value
         double pressureHpa = toHectopascals();
-        double tendency = getPressureTendency(previousPressure);
+        double tendency = pressureHpa - previousPressure.toHectopascals();
         
-        // Analyze combination of pressure and tendency
-        if (pressureHpa < 1000.0) {
-            return getLowPressureCondition(tendency);
-        }
-        if (pressureHpa > 1020.0) {
-            return getHighPressureCondition(tendency);
-        }
-        return getTendencyOnlyCondition(tendency);
-    }
-    
-    private String getLowPressureCondition(double tendency) {
-        if (tendency < -2.0) {
-            return "Deteriorating weather, storm approaching";
-        }
-        if (tendency > 2.0) {
-            return "Improving weather, storm clearing";
-        }
-        return getTendencyOnlyCondition(tendency);
-    }
-    
-    private String getHighPressureCondition(double tendency) {
-        if (tendency > 1.0) {
-            return "Fair weather, becoming more settled";
-        }
-        if (tendency < -1.0) {
-            return "Fair weather, may deteriorate";
-        }
-        return getTendencyOnlyCondition(tendency);
-    }
-    
-    private String getTendencyOnlyCondition(double tendency) {
-        if (tendency < -3.0) {
-            return "Weather deteriorating";
+        // Analyze combination of pressure and tendency as a (pressure band, tendency band) lookup
+        int pressureBand;
+        if (pressureHpa < LOW_PRESSURE_THRESHOLD_HPA) {
+            pressureBand = 0;
+        } else if (pressureHpa > HIGH_PRESSURE_THRESHOLD_HPA) {
+            pressureBand = 2;
+        } else {
+            pressureBand = 1;
         }
-        if (tendency > 3.0) {
-            return "Weather improving";
+        
+        double[] stableRange = STABLE_TENDENCY_RANGES_HPA[pressureBand];
+        int tendencyBand;
+        if (tendency < stableRange[0]) {
+            tendencyBand = 0;
+        } else if (tendency > stableRange[1]) {
+            tendencyBand = 2;
+        } else {
+            tendencyBand = 1;
         }
-        return "Weather conditions stable";
+        
+        return CONDITIONS_BY_BAND[pressureBand][tendencyBand];
     }
     
     // ==================== Formatting Methods ====================
@@ -476,7 +495,7 @@ public record Pressure(
      * @return Standard pressure (1013.25 hPa / 29.92 inHg)
      */
     public static Pressure standard() {
-        return new Pressure(STANDARD_PRESSURE_HPA, PressureUnit.HECTOPASCALS);
+        return STANDARD;
     }
     
     /**
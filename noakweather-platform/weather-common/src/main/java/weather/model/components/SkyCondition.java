@@ -57,6 +57,16 @@ public record SkyCondition(
      */
     private static final int MAX_CLOUD_HEIGHT_FEET = 100000;
     
+    /**
+     * Shared clear sky (CLR) instance - records are immutable, so one instance serves all reports.
+     */
+    private static final SkyCondition CLEAR = new SkyCondition(SkyCoverage.CLR, null, null);
+    
+    /**
+     * Shared sky clear (SKC) instance.
+     */
+    private static final SkyCondition SKY_CLEAR = new SkyCondition(SkyCoverage.SKC, null, null);
+    
     /**
      * Compact constructor with validation.
      */
@@ -284,7 +294,7 @@ public record SkyCondition(
      * @return SkyCondition representing clear skies
      */
     public static SkyCondition clear() {
-        return new SkyCondition(SkyCoverage.CLR, null, null);
+        return CLEAR;
     }
     
     /**
@@ -293,6 +303,6 @@ public record SkyCondition(
      * @return SkyCondition representing sky clear
      */
     public static SkyCondition skyClear() {
-        return new SkyCondition(SkyCoverage.SKC, null, null);
+        return SKY_CLEAR;
     }
 }
@@ -18,6 +18,8 @@ package weather.model.components;
 
 import java.time.Instant;
 
+import weather.model.enums.TemperatureUnit;
+
 /**
  * Immutable value object representing temperature information.
  * <p>
@@ -78,14 +80,17 @@ public record Temperature(
     public static final double FREEZING_POINT_CELSIUS = 0.0;
 
     /** Freezing point in Fahrenheit */
-    public static final double FREEZING_POINT_FAHRENHEIT = 32.0;
+    public static final double FREEZING_POINT_FAHRENHEIT = TemperatureUnit.FREEZING_POINT_FAHRENHEIT;
 
     /** Fahrenheit to Celsius conversion factor (5/9) */
-    public static final double FAHRENHEIT_TO_CELSIUS_FACTOR = 5.0 / 9.0;
+    public static final double FAHRENHEIT_TO_CELSIUS_FACTOR = TemperatureUnit.FAHRENHEIT_SCALE;
 
     /** Celsius to Fahrenheit conversion factor (9/5) */
     public static final double CELSIUS_TO_FAHRENHEIT_FACTOR = 9.0 / 5.0;
 
+    /** Offset between Kelvin and Celsius scales */
+    public static final double KELVIN_OFFSET = TemperatureUnit.KELVIN_OFFSET;
+
     // Constants for August-Roche-Magnus approximation (WMO recommended)
     /** Magnus formula constant a */
     private static final double MAGNUS_A = 17.67;
@@ -212,7 +217,7 @@ public record Temperature(
         if (celsius == null) {
             return null;
         }
-        return celsius * CELSIUS_TO_FAHRENHEIT_FACTOR + FREEZING_POINT_FAHRENHEIT;
+        return celsiusToFahrenheit(celsius);
     }
 
     /**
@@ -224,7 +229,7 @@ public record Temperature(
         if (dewpointCelsius == null) {
             return null;
         }
-        return dewpointCelsius * CELSIUS_TO_FAHRENHEIT_FACTOR + FREEZING_POINT_FAHRENHEIT;
+        return celsiusToFahrenheit(dewpointCelsius);
     }
 
     /**
@@ -236,7 +241,7 @@ public record Temperature(
         if (maxCelsius == null) {
             return null;
         }
-        return maxCelsius * CELSIUS_TO_FAHRENHEIT_FACTOR + FREEZING_POINT_FAHRENHEIT;
+        return celsiusToFahrenheit(maxCelsius);
     }
 
     /**
@@ -248,7 +253,7 @@ public record Temperature(
         if (minCelsius == null) {
             return null;
         }
-        return minCelsius * CELSIUS_TO_FAHRENHEIT_FACTOR + FREEZING_POINT_FAHRENHEIT;
+        return celsiusToFahrenheit(minCelsius);
     }
 
     /**
@@ -260,7 +265,7 @@ public record Temperature(
         if (celsius == null) {
             return null;
         }
-        return celsius + 273.15;
+        return celsius + KELVIN_OFFSET;
     }
 
     /**
@@ -272,7 +277,85 @@ public record Temperature(
         if (dewpointCelsius == null) {
             return null;
         }
-        return dewpointCelsius + 273.15;
+        return dewpointCelsius + KELVIN_OFFSET;
+    }
+
+    /**
+     * Celsius to Fahrenheit on an unboxed value. Every Fahrenheit view of this
+     * record, and the heat index regression, goes through this one kernel.
+     *
+     * @param celsius temperature in Celsius
+     * @return temperature in Fahrenheit
+     */
+    private static double celsiusToFahrenheit(double celsius) {
+        return celsius * CELSIUS_TO_FAHRENHEIT_FACTOR + FREEZING_POINT_FAHRENHEIT;
+    }
+
+    /**
+     * Fahrenheit to Celsius on an unboxed value, shared by the factory,
+     * bulk and heat index paths.
+     * <p>
+     * Delegates to {@link TemperatureUnit#FAHRENHEIT}, which holds the
+     * precomputed scale and offset (F * 5/9 + (-32 * 5/9)), so the fused
+     * multiply-add form is defined in one place.
+     *
+     * @param fahrenheit temperature in Fahrenheit
+     * @return temperature in Celsius
+     */
+    private static double fahrenheitToCelsius(double fahrenheit) {
+        return TemperatureUnit.FAHRENHEIT.toCelsius(fahrenheit);
+    }
+
+    /**
+     * Kelvin to Celsius on an unboxed value, shared by the factory and bulk
+     * paths; delegates to {@link TemperatureUnit#KELVIN}.
+     *
+     * @param kelvin temperature in Kelvin
+     * @return temperature in Celsius
+     */
+    private static double kelvinToCelsius(double kelvin) {
+        return TemperatureUnit.KELVIN.toCelsius(kelvin);
+    }
+
+    // ==================== Bulk Conversion Methods ====================
+
+    /**
+     * Convert a batch of Fahrenheit readings to Celsius.
+     * <p>
+     * Intended for bulk callers decoding many observations at once: the values
+     * stay unboxed and the conversion is a single pass over the array.
+     *
+     * @param fahrenheit temperatures in Fahrenheit
+     * @return new array of temperatures in Celsius, in the same order
+     * @throws IllegalArgumentException if fahrenheit is null
+     */
+    public static double[] fahrenheitToCelsius(double[] fahrenheit) {
+        if (fahrenheit == null) {
+            throw new IllegalArgumentException("Fahrenheit values cannot be null");
+        }
+        double[] celsius = new double[fahrenheit.length];
+        for (int i = 0; i < fahrenheit.length; i++) {
+            celsius[i] = fahrenheitToCelsius(fahrenheit[i]);
+        }
+        return celsius;
+    }
+
+    /**
+     * Convert a batch of Kelvin readings to Celsius.
+     *
+     * @param kelvin temperatures in Kelvin
+     * @return new array of temperatures in Celsius, in the same order
+     * @throws IllegalArgumentException if kelvin is null
+     */
+    public static double[] kelvinToCelsius(double[] kelvin) {
+        if (kelvin == null) {
+            throw new IllegalArgumentException("Kelvin values cannot be null");
+        }
+        double[] celsius = new double[kelvin.length];
+        for (int i = 0; i < kelvin.length; i++) {
+            celsius[i] = kelvinToCelsius(kelvin[i]);
+        }
+        return celsius;
     }
 
     // ==================== Query Methods ====================
@@ -358,17 +441,28 @@ public record Temperature(
      *
      * @return relative humidity as percentage (0-100), or null if dewpoint not available
      */
-    @SuppressWarnings("java:S6885")  // Math.clamp not available in Java 17
     public Double getRelativeHumidity() {
         if (celsius == null || dewpointCelsius == null) {
             return null;
         }
+        return relativeHumidity(celsius, dewpointCelsius);
+    }
 
+    /**
+     * Relative humidity on unboxed values, shared by the derived checks
+     * (icing, heat index) so each works from a single unboxing of its inputs.
+     *
+     * @param t temperature in Celsius
+     * @param td dewpoint in Celsius
+     * @return relative humidity as percentage (0-100)
+     */
+    @SuppressWarnings("java:S6885")  // Math.clamp not available in Java 17
+    private static double relativeHumidity(double t, double td) {
         // Calculate saturation vapor pressure at temperature
-        double eT = MAGNUS_E0 * Math.exp((MAGNUS_A * celsius) / (celsius + MAGNUS_B));
+        double eT = MAGNUS_E0 * Math.exp((MAGNUS_A * t) / (t + MAGNUS_B));
 
         // Calculate saturation vapor pressure at dewpoint
-        double eTd = MAGNUS_E0 * Math.exp((MAGNUS_A * dewpointCelsius) / (dewpointCelsius + MAGNUS_B));
+        double eTd = MAGNUS_E0 * Math.exp((MAGNUS_A * td) / (td + MAGNUS_B));
 
         // Calculate relative humidity as percentage
         double rh = 100.0 * (eTd / eT);
@@ -410,18 +504,14 @@ public record Temperature(
      * @return true if icing conditions are likely
      */
     public boolean isIcingLikely() {
-        if (celsius == null) {
+        // Icing typically occurs between 0°C and -20°C; outside that range the
+        // humidity derivation (two exponentials) is not needed at all
+        if (celsius == null || celsius > FREEZING_POINT_CELSIUS || celsius < -20.0) {
             return false;
         }
 
-        // Icing typically occurs between 0°C and -20°C
-        boolean temperatureRange = celsius <= FREEZING_POINT_CELSIUS && celsius >= -20.0;
-
-        // Check if humidity is high (if available)
-        Double rh = getRelativeHumidity();
-        boolean highHumidity = rh == null || rh >= 80.0;  // Assume high if not available
-
-        return temperatureRange && highHumidity;
+        // Check if humidity is high (assume high if dewpoint not available)
+        return dewpointCelsius == null || relativeHumidity(celsius, dewpointCelsius) >= 80.0;
     }
 
     /**
@@ -445,23 +535,22 @@ public record Temperature(
      * @return heat index in Celsius, or null if conditions not met (temp < 27°C / 80°F)
      */
     public Double getHeatIndex() {
-        // Heat index is only meaningful for warm temperatures
-        if (celsius == null || celsius < 27.0) {  // 27°C ≈ 80.6°F
+        // Heat index is only meaningful for warm temperatures, and needs humidity
+        if (celsius == null || dewpointCelsius == null) {
             return null;
         }
 
-        Double rh = getRelativeHumidity();
-        if (rh == null) {
+        // Unbox once; t feeds both the humidity and the Fahrenheit conversion
+        double t = celsius;
+        if (t < 27.0) {  // 27°C ≈ 80.6°F
             return null;
         }
 
-        // Convert to Fahrenheit for calculation (NOAA formula uses °F)
-        Double tf = toFahrenheit();
+        // Work on primitives from here on: rh and tf feed every term of the regression
+        double rh = relativeHumidity(t, dewpointCelsius);
 
-        // Add null check for extra safety
-        if (tf == null) {
-            return null;
-        }
+        // Convert to Fahrenheit for calculation (NOAA formula uses °F)
+        double tf = celsiusToFahrenheit(t);
 
         // Step 1: Calculate simple heat index (Steadman)
         double simpleHI = 0.5 * (tf + 61.0 + ((tf - 68.0) * 1.2) + (rh * 0.094));
@@ -472,7 +561,7 @@ public record Temperature(
         // Step 3: If average is less than 80°F, use simple formula
         if (avgHI < 80.0) {
             // Convert back to Celsius
-            return (simpleHI - FREEZING_POINT_FAHRENHEIT) * FAHRENHEIT_TO_CELSIUS_FACTOR;
+            return fahrenheitToCelsius(simpleHI);
         }
 
         // Step 4: Use full Rothfusz regression equation
@@ -482,7 +571,7 @@ public record Temperature(
         hi = applyHeatIndexAdjustments(tf, rh, hi);
 
         // Convert back to Celsius
-        return (hi - FREEZING_POINT_FAHRENHEIT) * FAHRENHEIT_TO_CELSIUS_FACTOR;
+        return fahrenheitToCelsius(hi);
     }
 
     /**
@@ -671,9 +760,9 @@ public record Temperature(
      * @return Temperature instance with values converted to Celsius
      */
     public static Temperature fromFahrenheit(double fahrenheit, Double dewpointFahrenheit) {
-        double celsius = (fahrenheit - FREEZING_POINT_FAHRENHEIT) * FAHRENHEIT_TO_CELSIUS_FACTOR;
+        double celsius = fahrenheitToCelsius(fahrenheit);
         Double dewpointCelsius = dewpointFahrenheit != null
-                ? (dewpointFahrenheit - FREEZING_POINT_FAHRENHEIT) * FAHRENHEIT_TO_CELSIUS_FACTOR
+                ? fahrenheitToCelsius(dewpointFahrenheit)
                 : null;
         return new Temperature(celsius, dewpointCelsius, null, null, null, null);
     }
@@ -686,8 +775,10 @@ public record Temperature(
      * @return Temperature instance with values converted to Celsius
      */
     public static Temperature fromKelvin(double kelvin, Double dewpointKelvin) {
-        double celsius = kelvin - 273.15;
-        Double dewpointCelsius = dewpointKelvin != null ? dewpointKelvin - 273.15 : null;
+        double celsius = kelvinToCelsius(kelvin);
+        Double dewpointCelsius = dewpointKelvin != null
+                ? kelvinToCelsius(dewpointKelvin)
+                : null;
         return new Temperature(celsius, dewpointCelsius, null, null, null, null);
     }
 
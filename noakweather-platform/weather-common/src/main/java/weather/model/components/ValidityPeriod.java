@@ -64,6 +64,14 @@ public record ValidityPeriod(
      */
     private static final int MIN_VALIDITY_HOURS = 1;
 
+    /** TAF validity formatter (DDHH, UTC) - formatters are immutable and thread-safe, so build once */
+    private static final DateTimeFormatter TAF_FORMAT = DateTimeFormatter.ofPattern("ddHH")
+            .withZone(ZoneOffset.UTC);
+
+    /** Full date-time formatter (UTC) */
+    private static final DateTimeFormatter FULL_FORMAT = DateTimeFormatter.ofPattern("yyyy-MM-dd HH:mm'Z'")
+            .withZone(ZoneOffset.UTC);
+
     /**
      * Compact constructor with validation.
      */
@@ -244,11 +252,8 @@ public record ValidityPeriod(
      * @return formatted string (e.g., "1520/1624")
      */
     public String toTafFormat() {
-        DateTimeFormatter formatter = DateTimeFormatter.ofPattern("ddHH")
-                .withZone(ZoneOffset.UTC);
-
-        String fromStr = formatter.format(validFrom);
-        String toStr = formatter.format(validTo);
+        String fromStr = TAF_FORMAT.format(validFrom);
+        String toStr = TAF_FORMAT.format(validTo);
 
         return fromStr + "/" + toStr;
     }
@@ -259,10 +264,7 @@ public record ValidityPeriod(
      * @return formatted string with full timestamps
      */
     public String toFullFormat() {
-        DateTimeFormatter formatter = DateTimeFormatter.ofPattern("yyyy-MM-dd HH:mm'Z'")
-                .withZone(ZoneOffset.UTC);
-
-        return formatter.format(validFrom) + " to " + formatter.format(validTo);
+        return FULL_FORMAT.format(validFrom) + " to " + FULL_FORMAT.format(validTo);
     }
 
     /**
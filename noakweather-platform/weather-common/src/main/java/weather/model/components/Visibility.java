@@ -60,9 +60,18 @@ public record Visibility(
     /** Kilometers per statute mile conversion factor */
     public static final double KM_PER_STATUTE_MILE = 1.609344;
     
-    /** Statute miles per kilometer conversion factor */
+    /** Statute miles per kilometer conversion factor (six significant digits, for display) */
     public static final double SM_PER_KILOMETER = 0.621371;
     
+    /** Statute miles per meter, so meter conversions multiply instead of divide */
+    private static final double STATUTE_MILES_PER_METER = 1.0 / METERS_PER_STATUTE_MILE;
+    
+    /** Kilometers per meter, so meter conversions multiply instead of divide */
+    private static final double KILOMETERS_PER_METER = 1.0 / METERS_PER_KILOMETER;
+    
+    /** Full-precision reciprocal of KM_PER_STATUTE_MILE, so KM and SM round-trip exactly */
+    private static final double STATUTE_MILES_PER_KILOMETER = 1.0 / KM_PER_STATUTE_MILE;
+    
     /** VFR minimum visibility in statute miles */
     public static final double VFR_MINIMUM_SM = 3.0;
     
@@ -78,6 +87,9 @@ public record Visibility(
     /** Unlimited visibility threshold in statute miles */
     public static final double UNLIMITED_VISIBILITY_SM = 6.0;
     
+    /** Shared CAVOK instance - records are immutable, so one instance serves all reports */
+    private static final Visibility CAVOK = new Visibility(null, null, false, false, "CAVOK");
+    
     /**
      * Compact constructor with validation.
  */
@@ -198,8 +210,7 @@ public record Visibility(
             return distanceValue >= UNLIMITED_VISIBILITY_SM;
         }
         
-        Double meters = toMeters();
-        return meters != null && meters >= UNLIMITED_VISIBILITY_METERS;
+        return distanceValue != null && distanceInMeters() >= UNLIMITED_VISIBILITY_METERS;
     }
     
     /**
@@ -213,11 +224,16 @@ public record Visibility(
             return true;
         }
         
-        Double sm = toStatuteMiles();
-        if (sm == null) {
-            return false;
-        }
-        
+        return distanceValue != null && meetsVfrMinimum(distanceInStatuteMiles());
+    }
+    
+    /**
+     * Apply the VFR rule to a distance already converted to statute miles.
+     * 
+     * @param sm visibility in statute miles
+     * @return true if visibility meets VFR minimums
+     */
+    private boolean meetsVfrMinimum(double sm) {
         // If it's "greater than" a value below VFR minimum, we can't be certain
         if (greaterThan) {
             return sm >= VFR_MINIMUM_SM;
@@ -242,11 +258,16 @@ public record Visibility(
             return false;
         }
         
-        Double sm = toStatuteMiles();
-        if (sm == null) {
-            return false;
-        }
-        
+        return distanceValue != null && isBelowIfrMaximum(distanceInStatuteMiles());
+    }
+    
+    /**
+     * Apply the IFR rule to a distance already converted to statute miles.
+     * 
+     * @param sm visibility in statute miles
+     * @return true if visibility is IFR conditions
+     */
+    private boolean isBelowIfrMaximum(double sm) {
         // If it's "less than" any value <= IFR max, it's IFR
         if (lessThan) {
             return true;
@@ -265,8 +286,7 @@ public record Visibility(
             return false;
         }
         
-        Double sm = toStatuteMiles();
-        if (sm == null) {
+        if (distanceValue == null) {
             return false;
         }
         
@@ -275,7 +295,7 @@ public record Visibility(
             return true;
         }
         
-        return sm < LOW_VISIBILITY_SM;
+        return distanceInStatuteMiles() < LOW_VISIBILITY_SM;
     }
     
     // ==================== Conversion Methods ====================
@@ -287,14 +307,19 @@ public record Visibility(
      * @throws IllegalStateException if unit is not recognized (should never happen due to constructor validation)
      */
     public Double toMeters() {
-        if (distanceValue == null) {
-            return null;
-        }
-        
+        return distanceValue != null ? distanceInMeters() : null;
+    }
+    
+    /**
+     * Distance in meters as a primitive, for callers that have already
+     * checked distanceValue is present (no boxing of the result).
+     */
+    private double distanceInMeters() {
+        double value = distanceValue;
         return switch (unit) {
-            case "M" -> distanceValue;
-            case "KM" -> distanceValue * METERS_PER_KILOMETER;
-            case "SM" -> distanceValue * METERS_PER_STATUTE_MILE;
+            case "M" -> value;
+            case "KM" -> value * METERS_PER_KILOMETER;
+            case "SM" -> value * METERS_PER_STATUTE_MILE;
             // Defensive: should never reach here due to constructor validation
             default -> throw new IllegalStateException("Unknown unit: " + unit);
         };
@@ -307,14 +332,19 @@ public record Visibility(
      * @throws IllegalStateException if unit is not recognized (should never happen due to constructor validation)
      */
     public Double toStatuteMiles() {
-        if (distanceValue == null) {
-            return null;
-        }
-        
+        return distanceValue != null ? distanceInStatuteMiles() : null;
+    }
+    
+    /**
+     * Distance in statute miles as a primitive, for the flight rule checks
+     * and summary once they have checked distanceValue is present.
+     */
+    private double distanceInStatuteMiles() {
+        double value = distanceValue;
         return switch (unit) {
-            case "SM" -> distanceValue;
-            case "M" -> distanceValue / METERS_PER_STATUTE_MILE;
-            case "KM" -> distanceValue * SM_PER_KILOMETER;
+            case "SM" -> value;
+            case "M" -> value * STATUTE_MILES_PER_METER;
+            case "KM" -> value * STATUTE_MILES_PER_KILOMETER;
             // Defensive: should never reach here due to constructor validation
             default -> throw new IllegalStateException("Unknown unit: " + unit);
         };
@@ -333,7 +363,7 @@ public record Visibility(
         
         return switch (unit) {
             case "KM" -> distanceValue;
-            case "M" -> distanceValue / METERS_PER_KILOMETER;
+            case "M" -> distanceValue * KILOMETERS_PER_METER;
             case "SM" -> distanceValue * KM_PER_STATUTE_MILE;
             // Defensive: should never reach here due to constructor validation
             default -> throw new IllegalStateException("Unknown unit: " + unit);
@@ -377,10 +407,11 @@ public record Visibility(
         
         summary.append(unitText);
         
-        // Add flight rules indicator
-        if (isVFR()) {
+        // Add flight rules indicator - convert once and reuse for both checks
+        double sm = distanceInStatuteMiles();
+        if (meetsVfrMinimum(sm)) {
             summary.append(" (VFR)");
-        } else if (isIFR()) {
+        } else if (isBelowIfrMaximum(sm)) {
             summary.append(" (IFR)");
         }
         
@@ -395,7 +426,7 @@ public record Visibility(
      * @return Visibility instance representing CAVOK
      */
     public static Visibility cavok() {
-        return new Visibility(null, null, false, false, "CAVOK");
+        return CAVOK;
     }
     
     /**
@@ -16,6 +16,8 @@
  */
 package weather.model.components;
 
+import java.util.Arrays;
+
 import weather.utils.ValidationPatterns;
 
 /**
@@ -64,9 +66,24 @@ public record Wind(
     /** Gale force threshold in knots (34+ KT, Beaufort 8) */
     private static final int GALE_THRESHOLD_KT = 34;
     
-    /** Beaufort scale upper thresholds in knots for scales 1-11 (scale 12 is 64+) */
+    /**
+     * Beaufort scale upper thresholds in knots for scales 1-11 (scale 12 is 64+).
+     * Must stay sorted ascending - {@link #beaufortScaleForKnots(int)} binary searches it.
+     */
     private static final int[] BEAUFORT_THRESHOLDS = {3, 6, 10, 16, 21, 27, 33, 40, 47, 55, 63};
     
+    /** 16-point compass rose, clockwise from north */
+    private static final String[] COMPASS_POINTS = {
+        "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+        "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"
+    };
+    
+    /** Cardinal direction for every valid whole-degree direction (0-360), built once at class load */
+    private static final String[] CARDINAL_BY_DEGREE = buildCardinalLookup();
+    
+    /** Shared calm wind instance (00000KT) - records are immutable, so one instance serves all reports */
+    private static final Wind CALM = new Wind(null, 0, null, null, null, "KT");
+    
     /**
      * Compact constructor with validation.
      */
@@ -79,6 +96,21 @@ public record Wind(
         validateGustVsSpeed(speedValue, gustValue);
     }
     
+    /**
+     * Build the degree to cardinal direction lookup table.
+     * Each of the 16 compass points covers 22.5°, centered on its heading.
+     * 
+     * @return lookup table indexed by direction in degrees (0-360)
+     */
+    private static String[] buildCardinalLookup() {
+        String[] lookup = new String[MAX_DIRECTION_DEGREES + 1];
+        for (int degrees = MIN_DIRECTION_DEGREES; degrees <= MAX_DIRECTION_DEGREES; degrees++) {
+            int index = (int) Math.round(degrees / 22.5) % COMPASS_POINTS.length;
+            lookup[degrees] = COMPASS_POINTS[index];
+        }
+        return lookup;
+    }
+    
     /**
      * Generate a range validation error message.
      * 
@@ -234,8 +266,7 @@ public record Wind(
      * @return true if wind is strong
      */
     public boolean isStrongWind() {
-        Integer speedKt = getSpeedKnots();
-        return speedKt != null && speedKt >= STRONG_WIND_THRESHOLD_KT;
+        return speedValue != null && toKnots(speedValue) >= STRONG_WIND_THRESHOLD_KT;
     }
     
     /**
@@ -244,8 +275,7 @@ public record Wind(
      * @return true if wind is gale force or higher
      */
     public boolean isGale() {
-        Integer speedKt = getSpeedKnots();
-        return speedKt != null && speedKt >= GALE_THRESHOLD_KT;
+        return speedValue != null && toKnots(speedValue) >= GALE_THRESHOLD_KT;
     }
     
     // ==================== Conversion Methods ====================
@@ -263,11 +293,24 @@ public record Wind(
             return "VRB";
         }
         
-        // Convert degrees to cardinal direction (16 points)
-        String[] directions = {"N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-                               "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"};
-        int index = (int) Math.round(directionDegrees / 22.5) % 16;
-        return directions[index];
+        // Convert degrees to cardinal direction (16 points) - direction is validated to 0-360
+        return CARDINAL_BY_DEGREE[directionDegrees];
+    }
+    
+    /**
+     * Get the 16-point cardinal direction (N, NNE, NE, etc.) for a direction in degrees.
+     * 
+     * Shared with other wind-like components (e.g. peak wind remarks) so every
+     * degree maps through the same precomputed table.
+     * 
+     * @param degrees direction in degrees (0-360)
+     * @return cardinal direction string
+     * @throws IllegalArgumentException if degrees is outside 0-360
+     * @see #getCardinalDirection()
+     */
+    public static String cardinalDirectionFor(int degrees) {
+        validateDirection(degrees);
+        return CARDINAL_BY_DEGREE[degrees];
     }
     
     /**
@@ -276,15 +319,23 @@ public record Wind(
      * @return speed in knots, or null if speed is null
      */
     public Integer getSpeedKnots() {
-        if (speedValue == null) {
-            return null;
-        }
-        
-        return switch (unit.toUpperCase()) {
-            case "KT" -> speedValue;
-            case "MPS" -> (int) Math.round(speedValue * 1.94384);  // m/s to knots
-            case "KMH" -> (int) Math.round(speedValue * 0.539957); // km/h to knots
-            default -> speedValue; // Should not happen due to validation
+        return speedValue != null ? toKnots(speedValue) : null;
+    }
+    
+    /**
+     * Convert a speed in this wind's unit to knots.
+     * Works on primitives so the threshold checks avoid boxing the result.
+     * 
+     * @param speed speed in this wind's unit
+     * @return speed in knots
+     */
+    private int toKnots(int speed) {
+        // WIND_UNIT only accepts upper-case units, so no case folding is needed
+        return switch (unit) {
+            case "KT" -> speed;
+            case "MPS" -> (int) Math.round(speed * 1.94384);  // m/s to knots
+            case "KMH" -> (int) Math.round(speed * 0.539957); // km/h to knots
+            default -> speed; // Should not happen due to validation
         };
     }
     
@@ -298,7 +349,7 @@ public record Wind(
             return null;
         }
         
-        return switch (unit.toUpperCase()) {
+        return switch (unit) {
             case "KT" -> (int) Math.round(speedValue * 0.514444);  // knots to m/s
             case "MPS" -> speedValue;
             case "KMH" -> (int) Math.round(speedValue * 0.277778); // km/h to m/s
@@ -316,7 +367,7 @@ public record Wind(
             return null;
         }
         
-        return switch (unit.toUpperCase()) {
+        return switch (unit) {
             case "KT" -> speedValue * 1.852;      // knots to km/h
             case "MPS" -> speedValue * 3.6;       // m/s to km/h
             case "KMH" -> speedValue.doubleValue();
@@ -345,18 +396,30 @@ public record Wind(
      * @return Beaufort scale value (0-12)
      */
     public int getBeaufortScale() {
-        Integer speedKt = getSpeedKnots();
-        if (speedKt == null || speedKt < 1) {
+        return speedValue != null ? beaufortScaleForKnots(toKnots(speedValue)) : 0;
+    }
+    
+    /**
+     * Get Beaufort scale value (0-12) for a wind speed in knots.
+     * 
+     * Works on a primitive speed so bulk callers (e.g. classifying a column of
+     * observations) can categorize without building a Wind per value.
+     * 
+     * @param speedKnots wind speed in knots
+     * @return Beaufort scale value (0-12)
+     * @see #getBeaufortScale()
+     */
+    public static int beaufortScaleForKnots(int speedKnots) {
+        if (speedKnots < 1) {
             return 0;
         }
         
-        for (int i = 0; i < BEAUFORT_THRESHOLDS.length; i++) {
-            if (speedKt <= BEAUFORT_THRESHOLDS[i]) {
-                return i + 1;
-            }
+        // Index of the first threshold >= speed; past the end means hurricane force (64+ kt)
+        int index = Arrays.binarySearch(BEAUFORT_THRESHOLDS, speedKnots);
+        if (index < 0) {
+            index = -index - 1;
         }
-        
-        return 12; // Hurricane force (64+ kt)
+        return index + 1;
     }
     
     /**
@@ -409,7 +472,7 @@ public record Wind(
      * @return Wind instance representing calm conditions
      */
     public static Wind calm() {
-        return new Wind(null, 0, null, null, null, "KT");
+        return CALM;
     }
     
     /**
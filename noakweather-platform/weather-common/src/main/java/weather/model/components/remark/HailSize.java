@@ -16,6 +16,8 @@
  */
 package weather.model.components.remark;
 
+import java.util.Arrays;
+
 /**
  * Immutable value object representing hail size from METAR remarks.
  *
@@ -37,6 +39,21 @@ package weather.model.components.remark;
  */
 public record HailSize(double inches) {
 
+    /**
+     * Lower bounds in inches of each size category after "Pea-sized".
+     * Must stay sorted ascending - {@link #getSizeCategory()} binary searches it.
+     */
+    private static final double[] SIZE_CATEGORY_THRESHOLDS = {
+            0.25, 0.50, 0.75, 0.88, 1.50, 1.75, 2.50, 2.75, 4.0
+    };
+
+    /** Size category names, one more than there are thresholds */
+    private static final String[] SIZE_CATEGORIES = {
+            "Pea-sized", "Marble-sized", "Penny-sized", "Nickel-sized", "Quarter-sized",
+            "Golf ball-sized", "Tennis ball-sized", "Baseball-sized", "Softball-sized",
+            "Grapefruit-sized or larger"
+    };
+
     /**
      * Compact constructor with validation.
      */
@@ -95,27 +112,10 @@ public record HailSize(double inches) {
      * @return size description
      */
     public String getSizeCategory() {
-        if (inches < 0.25) {
-            return "Pea-sized";
-        } else if (inches < 0.50) {
-            return "Marble-sized";
-        } else if (inches < 0.75) {
-            return "Penny-sized";
-        } else if (inches < 0.88) {
-            return "Nickel-sized";
-        } else if (inches < 1.50) {
-            return "Quarter-sized";
-        } else if (inches < 1.75) {
-            return "Golf ball-sized";
-        } else if (inches < 2.50) {
-            return "Tennis ball-sized";
-        } else if (inches < 2.75) {
-            return "Baseball-sized";
-        } else if (inches < 4.0) {
-            return "Softball-sized";
-        } else {
-            return "Grapefruit-sized or larger";
-        }
+        // Category index is the number of thresholds <= inches (a threshold starts its category)
+        int index = Arrays.binarySearch(SIZE_CATEGORY_THRESHOLDS, inches);
+        index = index >= 0 ? index + 1 : -index - 1;
+        return SIZE_CATEGORIES[index];
     }
 
     /**
@@ -196,22 +196,22 @@ public record NoaaMetarRemarks(
         private VariableVisibility variableVisibility;
         private VariableCeiling variableCeiling;
         private CeilingSecondSite ceilingSecondSite;
-        private List<ObscurationLayer> obscurationLayers = new ArrayList<>();
-        private List<CloudType> cloudTypes = new ArrayList<>();
+        private List<ObscurationLayer> obscurationLayers = List.of();
+        private List<CloudType> cloudTypes = List.of();
         private Visibility towerVisibility;
         private Visibility surfaceVisibility;
         private PrecipitationAmount hourlyPrecipitation;
         private PrecipitationAmount sixHourPrecipitation;
         private PrecipitationAmount twentyFourHourPrecipitation;
         private HailSize hailSize;
-        private List<WeatherEvent> weatherEvents = new ArrayList<>();
-        private List<ThunderstormLocation> thunderstormLocations = new ArrayList<>();
+        private List<WeatherEvent> weatherEvents = List.of();
+        private List<ThunderstormLocation> thunderstormLocations = List.of();
         private PressureTendency pressureTendency;
         private Temperature sixHourMaxTemperature;
         private Temperature sixHourMinTemperature;
         private Temperature twentyFourHourMaxTemperature;
         private Temperature twentyFourHourMinTemperature;
-        private List<AutomatedMaintenanceIndicator> automatedMaintenanceIndicators = new ArrayList<>();
+        private List<AutomatedMaintenanceIndicator> automatedMaintenanceIndicators = List.of();
         private Boolean maintenanceRequired;
         private String freeText;
 
@@ -219,6 +219,14 @@ public record NoaaMetarRemarks(
             // Private constructor - use NoaaMetarRemarks.builder()
         }
 
+        /**
+         * List fields start as the shared empty list, since most remarks carry none
+         * of these groups; a working copy is made on the first add.
+         */
+        private static <T> List<T> editable(List<T> list) {
+            return list instanceof ArrayList ? list : new ArrayList<>(list);
+        }
+
         /**
          * Sets the automated station type.
          *
@@ -325,7 +333,7 @@ public record NoaaMetarRemarks(
          * @return this builder
          */
         public Builder obscurationLayers(List<ObscurationLayer> obscurationLayers) {
-            this.obscurationLayers = obscurationLayers != null ? new ArrayList<>(obscurationLayers) : new ArrayList<>();
+            this.obscurationLayers = obscurationLayers != null ? new ArrayList<>(obscurationLayers) : List.of();
             return this;
         }
 
@@ -337,6 +345,7 @@ public record NoaaMetarRemarks(
          */
         public Builder addObscurationLayer(ObscurationLayer layer) {
             if (layer != null) {
+                this.obscurationLayers = editable(this.obscurationLayers);
                 this.obscurationLayers.add(layer);
             }
             return this;
@@ -350,6 +359,7 @@ public record NoaaMetarRemarks(
          */
         public Builder addObscurationLayers(List<ObscurationLayer> layers) {
             if (layers != null) {
+                this.obscurationLayers = editable(this.obscurationLayers);
                 this.obscurationLayers.addAll(layers);
             }
             return this;
@@ -362,7 +372,7 @@ public record NoaaMetarRemarks(
          * @return this builder
          */
         public Builder cloudTypes(List<CloudType> cloudTypes) {
-            this.cloudTypes = cloudTypes != null ? new ArrayList<>(cloudTypes) : new ArrayList<>();
+            this.cloudTypes = cloudTypes != null ? new ArrayList<>(cloudTypes) : List.of();
             return this;
         }
 
@@ -374,6 +384,7 @@ public record NoaaMetarRemarks(
          */
         public Builder addCloudType(CloudType cloudType) {
             if (cloudType != null) {
+                this.cloudTypes = editable(this.cloudTypes);
                 this.cloudTypes.add(cloudType);
             }
             return this;
@@ -387,6 +398,7 @@ public record NoaaMetarRemarks(
          */
         public Builder addCloudTypes(List<CloudType> types) {
             if (types != null) {
+                this.cloudTypes = editable(this.cloudTypes);
                 this.cloudTypes.addAll(types);
             }
             return this;
@@ -465,7 +477,7 @@ public record NoaaMetarRemarks(
          * @return this builder
          */
         public Builder weatherEvents(List<WeatherEvent> weatherEvents) {
-            this.weatherEvents = weatherEvents != null ? new ArrayList<>(weatherEvents) : new ArrayList<>();
+            this.weatherEvents = weatherEvents != null ? new ArrayList<>(weatherEvents) : List.of();
             return this;
         }
 
@@ -477,6 +489,7 @@ public record NoaaMetarRemarks(
          */
         public Builder addWeatherEvent(WeatherEvent weatherEvent) {
             if (weatherEvent != null) {
+                this.weatherEvents = editable(this.weatherEvents);
                 this.weatherEvents.add(weatherEvent);
             }
             return this;
@@ -490,6 +503,7 @@ public record NoaaMetarRemarks(
          */
         public Builder addWeatherEvents(List<WeatherEvent> events) {
             if (events != null) {
+                this.weatherEvents = editable(this.weatherEvents);
                 this.weatherEvents.addAll(events);
             }
             return this;
@@ -502,6 +516,7 @@ public record NoaaMetarRemarks(
          * @return this builder
          */
         public Builder addThunderstormLocation(ThunderstormLocation location) {
+            this.thunderstormLocations = editable(this.thunderstormLocations);
             this.thunderstormLocations.add(location);
             return this;
         }
@@ -513,7 +528,7 @@ public record NoaaMetarRemarks(
          * @return this builder
          */
         public Builder thunderstormLocations(List<ThunderstormLocation> locations) {
-            this.thunderstormLocations = locations != null ? new ArrayList<>(locations) : new ArrayList<>();
+            this.thunderstormLocations = locations != null ? new ArrayList<>(locations) : List.of();
             return this;
         }
 
@@ -580,7 +595,7 @@ public record NoaaMetarRemarks(
          */
         public Builder automatedMaintenanceIndicators(List<AutomatedMaintenanceIndicator> automatedMaintenanceIndicators) {
             this.automatedMaintenanceIndicators = automatedMaintenanceIndicators != null ?
-                    new ArrayList<>(automatedMaintenanceIndicators) : new ArrayList<>();
+                    new ArrayList<>(automatedMaintenanceIndicators) : List.of();
             return this;
         }
 
@@ -592,6 +607,7 @@ public record NoaaMetarRemarks(
          */
         public Builder addAutomatedMaintenanceIndicator(AutomatedMaintenanceIndicator indicator) {
             if (indicator != null) {
+                this.automatedMaintenanceIndicators = editable(this.automatedMaintenanceIndicators);
                 this.automatedMaintenanceIndicators.add(indicator);
             }
             return this;
@@ -16,6 +16,8 @@
  */
 package weather.model.components.remark;
 
+import weather.model.components.Wind;
+
 /**
  * Immutable value object representing peak wind from remarks section.
  * 
@@ -84,9 +86,6 @@ public record PeakWind(
             return "UNKNOWN";
         }
         
-        String[] directions = {"N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-                               "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"};
-        int index = (int) Math.round(directionDegrees / 22.5) % 16;
-        return directions[index];
+        return Wind.cardinalDirectionFor(directionDegrees);
     }
 }
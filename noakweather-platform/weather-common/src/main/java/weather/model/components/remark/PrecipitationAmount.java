@@ -161,7 +161,7 @@ public record PrecipitationAmount(
         }
 
         // Check for trace (all slashes)
-        if (encodedValue.matches("/+")) {
+        if (isAllSlashes(encodedValue)) {
             return new PrecipitationAmount(null, periodHours, true);
         }
 
@@ -175,6 +175,19 @@ public record PrecipitationAmount(
         }
     }
 
+    /**
+     * Check whether a non-empty encoded value consists only of slashes.
+     * A direct character scan; this runs for every precipitation remark group.
+     */
+    private static boolean isAllSlashes(String encodedValue) {
+        for (int i = 0; i < encodedValue.length(); i++) {
+            if (encodedValue.charAt(i) != '/') {
+                return false;
+            }
+        }
+        return true;
+    }
+
     /**
      * Create trace precipitation.
      *
@@ -16,6 +16,10 @@
  */
 package weather.model.enums;
 
+import java.util.Collections;
+import java.util.HashMap;
+import java.util.Map;
+
 /**
  * Types of forecast change indicators used in TAF (Terminal Aerodrome Forecast) reports.
  *
@@ -103,6 +107,19 @@ public enum ChangeIndicator {
      */
     private final String description;
 
+    /**
+     * Lookup by report code, built once instead of scanning values() per parse.
+     */
+    private static final Map<String, ChangeIndicator> BY_CODE;
+
+    static {
+        Map<String, ChangeIndicator> byCode = new HashMap<>();
+        for (ChangeIndicator indicator : values()) {
+            byCode.put(indicator.code, indicator);
+        }
+        BY_CODE = Collections.unmodifiableMap(byCode);
+    }
+
     /**
      * Constructor for ChangeIndicator enum.
      *
@@ -222,13 +239,7 @@ public enum ChangeIndicator {
         }
 
         // Match exact codes
-        for (ChangeIndicator indicator : values()) {
-            if (indicator.code.equals(normalized)) {
-                return indicator;
-            }
-        }
-
-        return null;
+        return BY_CODE.get(normalized);
     }
 
     /**
@@ -16,6 +16,10 @@
  */
 package weather.model.enums;
 
+import java.util.Collections;
+import java.util.HashMap;
+import java.util.Map;
+
 /**
  * Sky coverage enumeration.
  * Represents the amount of sky covered by clouds in oktas (eighths).
@@ -51,6 +55,17 @@ public enum SkyCoverage {
     private final String code;
     private final int oktas;
     
+    /** Lookup by METAR code, built once instead of scanning values() per parse */
+    private static final Map<String, SkyCoverage> BY_CODE;
+    
+    static {
+        Map<String, SkyCoverage> byCode = new HashMap<>();
+        for (SkyCoverage coverage : values()) {
+            byCode.put(coverage.code, coverage);
+        }
+        BY_CODE = Collections.unmodifiableMap(byCode);
+    }
+    
     SkyCoverage(String code, int oktas) {
         this.code = code;
         this.oktas = oktas;
@@ -72,10 +87,9 @@ public enum SkyCoverage {
      * @throws IllegalArgumentException if code is not recognized
      */
     public static SkyCoverage fromCode(String code) {
-        for (SkyCoverage coverage : values()) {
-            if (coverage.getCode().equals(code)) {
-                return coverage;
-            }
+        SkyCoverage coverage = BY_CODE.get(code);
+        if (coverage != null) {
+            return coverage;
         }
         throw new IllegalArgumentException("Unknown sky coverage code: " + code);
     }
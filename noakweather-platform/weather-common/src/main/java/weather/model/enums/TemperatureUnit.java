@@ -0,0 +1,161 @@
+/*
+ * NoakWeather Engineering Pipeline(TM) is a multi-source weather data engineering platform
+ * Copyright (C) 2025-2026 bclasky1539
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+package weather.model.enums;
+
+/**
+ * Enumeration of temperature units.
+ * <p>
+ * Each constant carries its own conversion to Celsius, so a caller that knows
+ * the source unit up front (e.g. a feed that always reports Kelvin) resolves
+ * the unit once and then converts every value without branching on it again.
+ * 
+ * @author bclasky1539
+ * 
+ */
+public enum TemperatureUnit {
+    /** Degrees Celsius (METAR/TAF standard) */
+    CELSIUS("C") {
+        @Override
+        public double toCelsius(double value) {
+            return value;
+        }
+    },
+    
+    /** Degrees Fahrenheit */
+    FAHRENHEIT("F") {
+        @Override
+        public double toCelsius(double value) {
+            return value * FAHRENHEIT_SCALE + FAHRENHEIT_OFFSET;
+        }
+    },
+    
+    /** Kelvin */
+    KELVIN("K") {
+        @Override
+        public double toCelsius(double value) {
+            return value - KELVIN_OFFSET;
+        }
+    };
+    
+    /** Freezing point in Fahrenheit */
+    public static final double FREEZING_POINT_FAHRENHEIT = 32.0;
+    
+    /** Fahrenheit to Celsius scale (5/9) */
+    public static final double FAHRENHEIT_SCALE = 5.0 / 9.0;
+    
+    /** Fahrenheit to Celsius offset (-32 * 5/9), folded at compile time */
+    private static final double FAHRENHEIT_OFFSET = -FREEZING_POINT_FAHRENHEIT * FAHRENHEIT_SCALE;
+    
+    /** Offset between Kelvin and Celsius scales */
+    public static final double KELVIN_OFFSET = 273.15;
+    
+    /**
+     * Units indexed by the low five bits of their symbol character, which
+     * are the same for upper and lower case ('C'/'c' -> 3, 'F'/'f' -> 6,
+     * 'K'/'k' -> 11), so parsing needs no case folding or string compares.
+     */
+    private static final TemperatureUnit[] BY_SYMBOL_INDEX = new TemperatureUnit[32];
+    
+    static {
+        for (TemperatureUnit unit : values()) {
+            BY_SYMBOL_INDEX[unit.symbol.charAt(0) & 0x1F] = unit;
+        }
+    }
+    
+    private final String symbol;
+    
+    TemperatureUnit(String symbol) {
+        this.symbol = symbol;
+    }
+    
+    public String getSymbol() {
+        return symbol;
+    }
+    
+    /**
+     * Parse a temperature unit from its symbol, case-insensitively.
+     * 
+     * @param symbol unit symbol ('C', 'F' or 'K', either case)
+     * @return TemperatureUnit enum value
+     * @throws IllegalArgumentException if symbol is not recognized
+     */
+    public static TemperatureUnit fromSymbol(char symbol) {
+        TemperatureUnit unit = BY_SYMBOL_INDEX[symbol & 0x1F];
+        // Other characters share the low bits (e.g. '#' maps to 3 like 'C'),
+        // so confirm the match with the case bit (0x20) ignored
+        if (unit != null && (symbol | 0x20) == (unit.symbol.charAt(0) | 0x20)) {
+            return unit;
+        }
+        throw new IllegalArgumentException("Unknown temperature unit: " + symbol);
+    }
+    
+    /**
+     * Parse a temperature unit from a one-character symbol string.
+     * 
+     * @param symbol unit symbol ("C", "F" or "K", either case)
+     * @return TemperatureUnit enum value
+     * @throws IllegalArgumentException if symbol is not recognized
+     */
+    public static TemperatureUnit fromSymbol(String symbol) {
+        if (symbol == null || symbol.length() != 1) {
+            throw new IllegalArgumentException("Unknown temperature unit: " + symbol);
+        }
+        return fromSymbol(symbol.charAt(0));
+    }
+    
+    /**
+     * Convert a value in this unit to Celsius.
+     * 
+     * @param value temperature in this unit
+     * @return temperature in Celsius
+     */
+    public abstract double toCelsius(double value);
+    
+    /**
+     * Convert a column of temperatures with a parallel column of units to Celsius.
+     * <p>
+     * For batch decoders that gather observations into columns (values[i] is
+     * reported in units[i]) rather than converting field by field on each
+     * observation object; the whole batch is one pass over two flat arrays.
+     * 
+     * @param values temperature values
+     * @param units unit of each value, same length as values
+     * @return new array of temperatures in Celsius, in the same order
+     * @throws IllegalArgumentException if either array is null, the lengths
+     *         differ, or a unit is null
+     */
+    public static double[] toCelsius(double[] values, TemperatureUnit[] units) {
+        if (values == null || units == null) {
+            throw new IllegalArgumentException("Temperature values and units cannot be null");
+        }
+        if (values.length != units.length) {
+            throw new IllegalArgumentException(
+                "Temperature values and units must have the same length: "
+                    + values.length + " values, " + units.length + " units"
+            );
+        }
+        double[] celsius = new double[values.length];
+        for (int i = 0; i < values.length; i++) {
+            TemperatureUnit unit = units[i];
+            if (unit == null) {
+                throw new IllegalArgumentException("Temperature unit missing at index " + i);
+            }
+            celsius[i] = unit.toCelsius(values[i]);
+        }
+        return celsius;
+    }
+}
@@ -20,12 +20,14 @@ import org.junit.jupiter.api.DisplayName;
 import org.junit.jupiter.api.Test;
 
 import weather.model.components.*;
+import weather.model.enums.ChangeIndicator;
 import weather.model.enums.SkyCoverage;
 
 import java.time.Instant;
 import java.time.temporal.ChronoUnit;
 import java.util.ArrayList;
 import java.util.List;
+import java.util.Map;
 
 import static org.assertj.core.api.Assertions.assertThat;
 import static org.assertj.core.api.AssertionsForClassTypes.assertThatThrownBy;
@@ -382,6 +384,56 @@ class NoaaTafDataTest {
         assertThat(data.getProbabilityPeriods()).contains(prob);
     }
 
+    @Test
+    @DisplayName("Should group periods by change indicator in report order")
+    void testGetPeriodsByChangeIndicator() {
+        NoaaTafData data = new NoaaTafData();
+        Instant start = Instant.now();
+        Instant end = start.plus(24, ChronoUnit.HOURS);
+
+        ForecastPeriod base = ForecastPeriod.base(start, end, WeatherConditions.empty());
+        ForecastPeriod fm1 = ForecastPeriod.from(start.plus(3, ChronoUnit.HOURS), WeatherConditions.empty());
+        ForecastPeriod tempo = ForecastPeriod.tempo(start, start.plus(4, ChronoUnit.HOURS), WeatherConditions.empty());
+        ForecastPeriod fm2 = ForecastPeriod.from(start.plus(6, ChronoUnit.HOURS), WeatherConditions.empty());
+
+        data.addForecastPeriod(base);
+        data.addForecastPeriod(fm1);
+        data.addForecastPeriod(tempo);
+        data.addForecastPeriod(fm2);
+
+        Map<ChangeIndicator, List<ForecastPeriod>> grouped = data.getPeriodsByChangeIndicator();
+
+        assertThat(grouped).containsOnlyKeys(ChangeIndicator.BASE, ChangeIndicator.FM, ChangeIndicator.TEMPO);
+        assertThat(grouped.get(ChangeIndicator.BASE)).containsExactly(base);
+        assertThat(grouped.get(ChangeIndicator.FM)).containsExactly(fm1, fm2);
+        assertThat(grouped.get(ChangeIndicator.TEMPO)).containsExactly(tempo);
+        assertThat(grouped.get(ChangeIndicator.FM)).isEqualTo(data.getFromPeriods());
+    }
+
+    @Test
+    @DisplayName("Should refresh the change indicator index when periods change")
+    void testPeriodsByChangeIndicatorRefreshesAfterChanges() {
+        NoaaTafData data = new NoaaTafData();
+        Instant start = Instant.now();
+        Instant end = start.plus(24, ChronoUnit.HOURS);
+
+        data.addForecastPeriod(ForecastPeriod.base(start, end, WeatherConditions.empty()));
+        Map<ChangeIndicator, List<ForecastPeriod>> before = data.getPeriodsByChangeIndicator();
+
+        assertThat(data.getPeriodsByChangeIndicator()).isSameAs(before);
+        assertThat(data.getTempoPeriods()).isEmpty();
+
+        ForecastPeriod tempo = ForecastPeriod.tempo(start, start.plus(4, ChronoUnit.HOURS), WeatherConditions.empty());
+        data.addForecastPeriod(tempo);
+
+        assertThat(data.getTempoPeriods()).containsExactly(tempo);
+
+        data.setForecastPeriods(List.of(tempo));
+
+        assertThat(data.getBaseForecast()).isNull();
+        assertThat(data.getPeriodsByChangeIndicator()).containsOnlyKeys(ChangeIndicator.TEMPO);
+    }
+
     @Test
     @DisplayName("Should get current forecast period")
     void testGetCurrentForecastPeriod() {
@@ -505,6 +505,20 @@ class NoaaWeatherDataTest {
         assertThat(rvrList).hasSize(2);
     }
 
+    @Test
+    @DisplayName("Should share the empty runway visual range list until one is added")
+    void testRunwayVisualRangeSharedUntilAdded() {
+        NoaaWeatherData first = new NoaaWeatherData("KJFK", now, "METAR");
+        NoaaWeatherData second = new NoaaWeatherData("KLGA", now, "METAR");
+
+        assertThat(first.getRunwayVisualRange()).isSameAs(second.getRunwayVisualRange());
+
+        first.addRunwayVisualRange(RunwayVisualRange.of("04L", 2200));
+
+        assertThat(first.getRunwayVisualRange()).hasSize(1);
+        assertThat(second.getRunwayVisualRange()).isEmpty();
+    }
+
     @Test
     @DisplayName("Should not add null runway visual range")
     void testAddNullRunwayVisualRange() {
@@ -635,6 +649,26 @@ class NoaaWeatherDataTest {
         assertThat(data.getMinimumRvrFeet()).isEqualTo(1800);
     }
 
+    @Test
+    @DisplayName("Should use variable low and ignore cleared runways for minimum RVR")
+    void testGetMinimumRvrFeet_VariableAndCleared() {
+        NoaaWeatherData data = new NoaaWeatherData("KJFK", now, "METAR");
+        data.addRunwayVisualRange(RunwayVisualRange.variable("04L", 1200, 2400));
+        data.addRunwayVisualRange(RunwayVisualRange.cleared("04R"));
+        data.addRunwayVisualRange(RunwayVisualRange.of("22L", 1600));
+
+        assertThat(data.getMinimumRvrFeet()).isEqualTo(1200);
+    }
+
+    @Test
+    @DisplayName("Should return null minimum RVR when no runway reports a value")
+    void testGetMinimumRvrFeet_NoValues() {
+        NoaaWeatherData data = new NoaaWeatherData("KJFK", now, "METAR");
+        data.addRunwayVisualRange(RunwayVisualRange.cleared("04R"));
+
+        assertThat(data.getMinimumRvrFeet()).isNull();
+    }
+
     @Test
     @DisplayName("Should get RVR for specific runway")
     void testGetRvrForRunway() {
@@ -132,6 +132,7 @@ class WeatherConditionsTest {
             assertThat(conditions.skyConditions()).isEmpty();
             assertThat(conditions.temperature()).isNull();
             assertThat(conditions.pressure()).isNull();
+            assertThat(WeatherConditions.empty()).isSameAs(conditions);
         }
 
         @Test
@@ -532,6 +533,24 @@ class WeatherConditionsTest {
 
             assertThat(conditions.hasThunderstorms()).isFalse();
         }
+
+        @Test
+        void testHasPrecipitationOrThunderstorms() {
+            WeatherConditions dryThunderstorm = WeatherConditions.builder()
+                    .presentWeather(List.of(PresentWeather.parse("TS")))
+                    .build();
+            WeatherConditions rain = WeatherConditions.builder()
+                    .presentWeather(List.of(PresentWeather.parse("FG"), PresentWeather.parse("-RA")))
+                    .build();
+            WeatherConditions fog = WeatherConditions.builder()
+                    .presentWeather(List.of(PresentWeather.parse("FG")))
+                    .build();
+
+            assertThat(dryThunderstorm.hasPrecipitationOrThunderstorms()).isTrue();
+            assertThat(rain.hasPrecipitationOrThunderstorms()).isTrue();
+            assertThat(fog.hasPrecipitationOrThunderstorms()).isFalse();
+            assertThat(WeatherConditions.empty().hasPrecipitationOrThunderstorms()).isFalse();
+        }
     }
 
     @Nested
@@ -599,6 +618,21 @@ class WeatherConditionsTest {
             assertThat(conditions.isLikelyIMC()).isTrue();
         }
 
+        @Test
+        void testIsLikelyIMC_UsesLowestCeilingLayer() {
+            WeatherConditions conditions = WeatherConditions.builder()
+                    .visibility(Visibility.statuteMiles(10.0))
+                    .skyConditions(List.of(
+                            SkyCondition.of(SkyCoverage.FEW, 500),
+                            SkyCondition.of(SkyCoverage.OVERCAST, 3000),
+                            SkyCondition.of(SkyCoverage.BROKEN, 900)
+                    ))
+                    .build();
+
+            assertThat(conditions.isLikelyIMC()).isTrue();
+            assertThat(conditions.getCeilingFeet()).isEqualTo(900);
+        }
+
         @Test
         void testIsLikelyIMC_False_GoodConditions() {
             WeatherConditions conditions = WeatherConditions.builder()
@@ -23,6 +23,7 @@ import org.junit.jupiter.api.BeforeEach;
 import java.time.Instant;
 import java.util.HashMap;
 import java.util.Map;
+import java.util.UUID;
 
 import static org.junit.jupiter.api.Assertions.*;
 import static org.assertj.core.api.Assertions.assertThat;
@@ -79,6 +80,19 @@ class WeatherDataTest {
         assertNotEquals(data1.getId(), data2.getId(), "Each instance should have unique ID");
     }
 
+    @Test
+    @DisplayName("Should generate IDs as canonical version 4 UUID strings")
+    void testIdIsCanonicalUuid() {
+        TestWeatherData data = new TestWeatherData(WeatherDataSource.NOAA, "KJFK", now);
+
+        UUID uuid = UUID.fromString(data.getId());
+
+        assertEquals(36, data.getId().length(), "ID should keep the dashed UUID format");
+        assertEquals(uuid.toString(), data.getId());
+        assertEquals(4, uuid.version(), "ID should be a random (version 4) UUID");
+        assertEquals(2, uuid.variant(), "ID should use the IETF variant");
+    }
+
     @Test
     @DisplayName("Should set ingestion time close to creation time")
     void testIngestionTimeSetAutomatically() {
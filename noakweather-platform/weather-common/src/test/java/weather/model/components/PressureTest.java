@@ -574,6 +574,20 @@ class PressureTest {
             assertThat(current.getPressureTendencyDescription(previous)).isEqualTo("Rapidly falling");
         }
         
+        @Test
+        void testGetPressureTendencyDescription_ExactThresholdsFallIntoLowerBand() {
+            Pressure base = new Pressure(1013.0, PressureUnit.HECTOPASCALS);
+            
+            assertThat(new Pressure(1016.0, PressureUnit.HECTOPASCALS).getPressureTendencyDescription(base))
+                .isEqualTo("Rising");
+            assertThat(new Pressure(1014.0, PressureUnit.HECTOPASCALS).getPressureTendencyDescription(base))
+                .isEqualTo("Steady");
+            assertThat(new Pressure(1012.0, PressureUnit.HECTOPASCALS).getPressureTendencyDescription(base))
+                .isEqualTo("Falling");
+            assertThat(new Pressure(1010.0, PressureUnit.HECTOPASCALS).getPressureTendencyDescription(base))
+                .isEqualTo("Rapidly falling");
+        }
+        
         @Test
         void testGetWeatherCondition_NoPrevious_Stormy() {
             Pressure current = new Pressure(970.0, PressureUnit.HECTOPASCALS);
@@ -598,6 +612,20 @@ class PressureTest {
             assertThat(current.getWeatherCondition(null)).isEqualTo("Generally fair conditions");
         }
         
+        @ParameterizedTest
+        @CsvSource({
+            "979.9, Stormy conditions likely",
+            "980.0, Unsettled weather likely",
+            "999.9, Unsettled weather likely",
+            "1000.0, Generally fair conditions",
+            "1030.0, Generally fair conditions",
+            "1030.1, Fair weather likely"
+        })
+        void testGetWeatherCondition_NoPrevious_Boundaries(double hPa, String expected) {
+            Pressure current = new Pressure(hPa, PressureUnit.HECTOPASCALS);
+            assertThat(current.getWeatherCondition(null)).isEqualTo(expected);
+        }
+        
         @Test
         void testGetWeatherCondition_LowAndFalling() {
             Pressure current = new Pressure(995.0, PressureUnit.HECTOPASCALS);
@@ -816,6 +844,7 @@ class PressureTest {
             
             assertThat(pressure.value()).isEqualTo(1013.25);
             assertThat(pressure.unit()).isEqualTo(PressureUnit.HECTOPASCALS);
+            assertThat(Pressure.standard()).isSameAs(pressure);
         }
         
         @Test
@@ -449,6 +449,12 @@ class SkyConditionTest {
         assertThat(sky.isClear()).isTrue();
     }
     
+    @Test
+    void testFactoryMethod_ClearSkiesReturnSharedInstances() {
+        assertThat(SkyCondition.clear()).isSameAs(SkyCondition.clear());
+        assertThat(SkyCondition.skyClear()).isSameAs(SkyCondition.skyClear());
+    }
+    
     // ==================== Real-World METAR Examples ====================
     
     @Test
@@ -257,6 +257,52 @@ class TemperatureTest {
         }
     }
 
+    // ==================== Bulk Conversion Tests ====================
+
+    @Nested
+    @SuppressWarnings("java:S2187")  // SonarQube: @Nested test classes contain tests in methods
+    @DisplayName("Bulk Conversions")
+    class BulkConversionTests {
+
+        @Test
+        void testFahrenheitToCelsius_Array() {
+            double[] celsius = Temperature.fahrenheitToCelsius(new double[]{32.0, -40.0, 98.6, 212.0});
+
+            assertThat(celsius).containsExactly(new double[]{0.0, -40.0, 37.0, 100.0}, within(0.01));
+        }
+
+        @Test
+        void testKelvinToCelsius_Array() {
+            double[] celsius = Temperature.kelvinToCelsius(new double[]{273.15, 298.15, 263.15});
+
+            assertThat(celsius).containsExactly(new double[]{0.0, 25.0, -10.0}, within(0.01));
+        }
+
+        @Test
+        void testBulkConversion_EmptyArray() {
+            assertThat(Temperature.fahrenheitToCelsius(new double[0])).isEmpty();
+            assertThat(Temperature.kelvinToCelsius(new double[0])).isEmpty();
+        }
+
+        @Test
+        void testBulkConversion_MatchesFactoryConversion() {
+            double[] fahrenheit = {-4.0, 50.0, 81.0};
+            double[] celsius = Temperature.fahrenheitToCelsius(fahrenheit);
+
+            for (int i = 0; i < fahrenheit.length; i++) {
+                assertThat(celsius[i]).isEqualTo(Temperature.fromFahrenheit(fahrenheit[i], null).celsius());
+            }
+        }
+
+        @Test
+        void testBulkConversion_NullArrayThrows() {
+            assertThatThrownBy(() -> Temperature.fahrenheitToCelsius(null))
+                    .isInstanceOf(IllegalArgumentException.class);
+            assertThatThrownBy(() -> Temperature.kelvinToCelsius(null))
+                    .isInstanceOf(IllegalArgumentException.class);
+        }
+    }
+
     // ==================== Freezing Tests ====================
 
     @Nested
@@ -19,6 +19,7 @@ package weather.model.components;
 import org.junit.jupiter.api.Test;
 import org.junit.jupiter.params.ParameterizedTest;
 import org.junit.jupiter.params.provider.CsvSource;
+import org.junit.jupiter.params.provider.ValueSource;
 
 import static org.assertj.core.api.Assertions.assertThat;
 import static org.assertj.core.api.Assertions.assertThatThrownBy;
@@ -364,6 +365,7 @@ class VisibilityTest {
         assertThat(visibility.specialCondition()).isEqualTo("CAVOK");
         assertThat(visibility.lessThan()).isFalse();
         assertThat(visibility.greaterThan()).isFalse();
+        assertThat(Visibility.cavok()).isSameAs(visibility);
     }
     
     @Test
@@ -456,6 +458,25 @@ class VisibilityTest {
                 .contains("(IFR)");
     }
     
+    @ParameterizedTest
+    @CsvSource({
+        "0.0, 0.00",
+        "0.125, 0.13",
+        "0.5, 0.50",
+        "1.375, 1.38",
+        "2.999, 3.00",
+        "1.005, 1.01",
+        "2.675, 2.68",
+        "9999.0, 9999.00"
+    })
+    void testGetSummary_TwoDecimalRounding(double distance, String expected) {
+        // Decimal ties round half-up on the value as written (1.005 -> 1.01),
+        // even where the nearest double sits just below the tie
+        Visibility visibility = new Visibility(distance, "M", false, false, null);
+        
+        assertThat(visibility.getSummary()).startsWith(expected + " meters");
+    }
+    
     @Test
     void testGetSummary_LessThan() {
         Visibility visibility = Visibility.lessThan(0.25, "SM");
@@ -857,6 +878,25 @@ class VisibilityTest {
         assertThat(visibility.toStatuteMiles()).isCloseTo(1.0, org.assertj.core.data.Offset.offset(0.01));
     }
     
+    @ParameterizedTest
+    @ValueSource(doubles = {0.0, 800.0, 1609.344, 5000.0, 9999.0, 16093.44})
+    void testMeterConversions_MatchDivision(double meters) {
+        Visibility visibility = Visibility.meters(meters);
+        
+        assertThat(visibility.toStatuteMiles())
+            .isCloseTo(meters / Visibility.METERS_PER_STATUTE_MILE, within(1e-12));
+        assertThat(visibility.toKilometers())
+            .isCloseTo(meters / Visibility.METERS_PER_KILOMETER, within(1e-12));
+    }
+    
+    @Test
+    void testToStatuteMiles_OneMileIsExact() {
+        // Conversions go through a single full-precision factor, so one statute
+        // mile expressed in meters or kilometers comes back as exactly 1.0
+        assertThat(Visibility.meters(1609.344).toStatuteMiles()).isEqualTo(1.0);
+        assertThat(Visibility.kilometers(1.609344).toStatuteMiles()).isEqualTo(1.0);
+    }
+    
     @Test
     void testToStatuteMiles_KilometersUnit() {
         Visibility visibility = Visibility.kilometers(1.60934);
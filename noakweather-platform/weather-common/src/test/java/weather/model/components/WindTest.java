@@ -341,6 +341,19 @@ class WindTest {
         assertThat(wind.getCardinalDirection()).isEqualTo("N");
     }
     
+    @ParameterizedTest
+    @CsvSource({
+        "11, N",    // Just below the N/NNE boundary (11.25°)
+        "12, NNE",
+        "348, NNW", // Just below the NNW/N boundary (348.75°)
+        "349, N",
+        "225, SW"
+    })
+    void testGetCardinalDirection_SectorBoundaries(int degrees, String expected) {
+        Wind wind = new Wind(degrees, 10, null, null, null, "KT");
+        assertThat(wind.getCardinalDirection()).isEqualTo(expected);
+    }
+    
     @Test
     void testGetCardinalDirection_East() {
         Wind wind = new Wind(90, 10, null, null, null, "KT");
@@ -395,6 +408,23 @@ class WindTest {
         assertThat(wind.getCardinalDirection()).isEqualTo("CALM");
     }
     
+    @Test
+    void testCardinalDirectionFor_MatchesInstanceMethod() {
+        for (int degrees = 0; degrees <= 360; degrees++) {
+            Wind wind = new Wind(degrees, 10, null, null, null, "KT");
+            assertThat(Wind.cardinalDirectionFor(degrees))
+                .as("cardinal direction for %d degrees", degrees)
+                .isEqualTo(wind.getCardinalDirection());
+        }
+    }
+    
+    @Test
+    void testCardinalDirectionFor_OutOfRange() {
+        assertThatThrownBy(() -> Wind.cardinalDirectionFor(361))
+            .isInstanceOf(IllegalArgumentException.class)
+            .hasMessageContaining("Wind direction must be between 0 and 360");
+    }
+    
     // ==================== Unit Conversion Tests ====================
     
     @Test
@@ -546,6 +576,21 @@ class WindTest {
         assertThat(wind.getBeaufortScale()).isEqualTo(expectedBeaufort);
     }
     
+    @Test
+    void testBeaufortScaleForKnots_MatchesInstanceMethod() {
+        for (int knots = 0; knots <= 100; knots++) {
+            Wind wind = new Wind(280, knots, null, null, null, "KT");
+            assertThat(Wind.beaufortScaleForKnots(knots))
+                .as("Beaufort scale for %d KT", knots)
+                .isEqualTo(wind.getBeaufortScale());
+        }
+    }
+    
+    @Test
+    void testBeaufortScaleForKnots_NegativeSpeedIsCalm() {
+        assertThat(Wind.beaufortScaleForKnots(-5)).isZero();
+    }
+    
     @Test
     void testGetBeaufortScale_NullSpeed() {
         Wind wind = new Wind(280, null, null, null, null, "KT");
@@ -619,6 +664,7 @@ class WindTest {
         assertThat(wind.directionDegrees()).isNull();
         assertThat(wind.speedValue()).isZero();
         assertThat(wind.unit()).isEqualTo("KT");
+        assertThat(Wind.calm()).isSameAs(wind);
     }
     
     @Test
@@ -138,6 +138,26 @@ class HailSizeTest {
         assertEquals(expectedCategory, hailSize.getSizeCategory());
     }
 
+    @ParameterizedTest
+    @CsvSource({
+            "0.24, 'Pea-sized'",
+            "0.25, 'Marble-sized'",
+            "0.50, 'Penny-sized'",
+            "0.75, 'Nickel-sized'",
+            "0.87, 'Nickel-sized'",
+            "0.88, 'Quarter-sized'",
+            "1.50, 'Golf ball-sized'",
+            "1.75, 'Tennis ball-sized'",
+            "2.50, 'Baseball-sized'",
+            "2.75, 'Softball-sized'",
+            "3.99, 'Softball-sized'",
+            "4.00, 'Grapefruit-sized or larger'"
+    })
+    @DisplayName("Should start each size category at its lower threshold")
+    void testSizeCategoryBoundaries(double inches, String expectedCategory) {
+        assertEquals(expectedCategory, new HailSize(inches).getSizeCategory());
+    }
+
     @Test
     @DisplayName("Should categorize pea-sized hail")
     void testPeaSized() {
@@ -261,4 +261,17 @@ class PeakWindTest {
         
         assertThat(peakWind.getCardinalDirection()).isEqualTo("SSW");
     }
+    
+    @Test
+    void testGetCardinalDirection_MatchesNearestSectorForAllDegrees() {
+        String[] directions = {"N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+                               "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"};
+        
+        for (int degrees = 0; degrees <= 360; degrees++) {
+            String expected = directions[(int) Math.round(degrees / 22.5) % 16];
+            assertThat(new PeakWind(degrees, 32, 15, 30).getCardinalDirection())
+                .as("direction %d", degrees)
+                .isEqualTo(expected);
+        }
+    }
 }
@@ -148,6 +148,14 @@ class PrecipitationAmountTest {
                 () -> PrecipitationAmount.fromEncoded("ABCD", 1));
     }
 
+    @ParameterizedTest
+    @ValueSource(strings = {"//1/", "0/", "/0015"})
+    @DisplayName("Should reject values mixing slashes and digits")
+    void testFromEncodedPartialSlashes(String encoded) {
+        assertThrows(IllegalArgumentException.class,
+                () -> PrecipitationAmount.fromEncoded(encoded, 1));
+    }
+
     @Test
     @DisplayName("Should throw exception for invalid period in fromEncoded")
     void testFromEncodedInvalidPeriod() {
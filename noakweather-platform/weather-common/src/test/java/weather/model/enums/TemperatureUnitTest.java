@@ -0,0 +1,132 @@
+/*
+ * NoakWeather Engineering Pipeline(TM) is a multi-source weather data engineering platform
+ * Copyright (C) 2025-2026 bclasky1539
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+package weather.model.enums;
+
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.params.ParameterizedTest;
+import org.junit.jupiter.params.provider.CsvSource;
+import org.junit.jupiter.params.provider.NullAndEmptySource;
+import org.junit.jupiter.params.provider.ValueSource;
+import weather.model.components.Temperature;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.assertj.core.api.Assertions.assertThatThrownBy;
+import static org.assertj.core.api.Assertions.within;
+
+/**
+ * Tests for TemperatureUnit enum.
+ * 
+ * @author bclasky1539
+ *
+ */
+class TemperatureUnitTest {
+    
+    @Test
+    void testSymbols() {
+        assertThat(TemperatureUnit.CELSIUS.getSymbol()).isEqualTo("C");
+        assertThat(TemperatureUnit.FAHRENHEIT.getSymbol()).isEqualTo("F");
+        assertThat(TemperatureUnit.KELVIN.getSymbol()).isEqualTo("K");
+    }
+    
+    @Test
+    void testEnumValues() {
+        assertThat(TemperatureUnit.values()).containsExactly(
+            TemperatureUnit.CELSIUS,
+            TemperatureUnit.FAHRENHEIT,
+            TemperatureUnit.KELVIN
+        );
+    }
+    
+    @ParameterizedTest
+    @CsvSource({
+        "C, CELSIUS",
+        "c, CELSIUS",
+        "F, FAHRENHEIT",
+        "f, FAHRENHEIT",
+        "K, KELVIN",
+        "k, KELVIN"
+    })
+    void testFromSymbol(String symbol, TemperatureUnit expected) {
+        assertThat(TemperatureUnit.fromSymbol(symbol)).isEqualTo(expected);
+        assertThat(TemperatureUnit.fromSymbol(symbol.charAt(0))).isEqualTo(expected);
+    }
+    
+    @ParameterizedTest
+    @ValueSource(strings = {"#", "S", "s", "&", "+", "X", "1", "CF", "KT"})
+    void testFromSymbol_Unknown(String symbol) {
+        assertThatThrownBy(() -> TemperatureUnit.fromSymbol(symbol))
+            .isInstanceOf(IllegalArgumentException.class)
+            .hasMessageContaining("Unknown temperature unit");
+    }
+    
+    @ParameterizedTest
+    @NullAndEmptySource
+    void testFromSymbol_NullOrEmpty(String symbol) {
+        assertThatThrownBy(() -> TemperatureUnit.fromSymbol(symbol))
+            .isInstanceOf(IllegalArgumentException.class);
+    }
+    
+    @ParameterizedTest
+    @CsvSource({
+        "CELSIUS, 22.0, 22.0",
+        "CELSIUS, -5.0, -5.0",
+        "FAHRENHEIT, 32.0, 0.0",
+        "FAHRENHEIT, -40.0, -40.0",
+        "FAHRENHEIT, 98.6, 37.0",
+        "KELVIN, 273.15, 0.0",
+        "KELVIN, 298.15, 25.0"
+    })
+    void testToCelsius(TemperatureUnit unit, double value, double expectedCelsius) {
+        assertThat(unit.toCelsius(value)).isCloseTo(expectedCelsius, within(1e-9));
+    }
+    
+    @Test
+    void testToCelsius_MixedUnitColumns() {
+        double[] values = {20.0, 68.0, 293.15, -40.0};
+        TemperatureUnit[] units = {
+            TemperatureUnit.CELSIUS,
+            TemperatureUnit.FAHRENHEIT,
+            TemperatureUnit.KELVIN,
+            TemperatureUnit.FAHRENHEIT
+        };
+        
+        assertThat(TemperatureUnit.toCelsius(values, units))
+            .containsExactly(new double[]{20.0, 20.0, 20.0, -40.0}, within(1e-9));
+    }
+    
+    @Test
+    void testToCelsius_MixedUnitColumnsValidation() {
+        double[] values = {20.0, 68.0};
+        
+        assertThatThrownBy(() -> TemperatureUnit.toCelsius(values, new TemperatureUnit[]{TemperatureUnit.CELSIUS}))
+            .isInstanceOf(IllegalArgumentException.class)
+            .hasMessageContaining("same length");
+        assertThatThrownBy(() -> TemperatureUnit.toCelsius(values, new TemperatureUnit[]{TemperatureUnit.CELSIUS, null}))
+            .isInstanceOf(IllegalArgumentException.class)
+            .hasMessageContaining("index 1");
+        assertThatThrownBy(() -> TemperatureUnit.toCelsius(null, new TemperatureUnit[0]))
+            .isInstanceOf(IllegalArgumentException.class);
+    }
+    
+    @Test
+    void testToCelsius_MatchesTemperatureFactories() {
+        assertThat(TemperatureUnit.FAHRENHEIT.toCelsius(81.0))
+            .isEqualTo(Temperature.fromFahrenheit(81.0, null).celsius());
+        assertThat(TemperatureUnit.KELVIN.toCelsius(300.0))
+            .isEqualTo(Temperature.fromKelvin(300.0, null).celsius());
+    }
+}
@@ -120,10 +120,9 @@ public class SpeedLayerProcessor {
         // Step 3: Upload to S3
         String s3Key = s3Service.uploadWeatherData(weatherData);
         weatherData.addMetadata("s3_key", s3Key);
-        weatherData.addMetadata("processing_duration_ms",
-                Duration.between(startTime, Instant.now()).toMillis());
 
         Duration duration = Duration.between(startTime, Instant.now());
+        weatherData.addMetadata("processing_duration_ms", duration.toMillis());
         logger.info("Processed weather data for station {} in {}ms (S3: {})",
                 weatherData.getStationId(), duration.toMillis(), s3Key);
 
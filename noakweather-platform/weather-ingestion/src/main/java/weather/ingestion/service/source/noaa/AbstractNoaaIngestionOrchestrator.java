@@ -125,12 +125,12 @@ public abstract class AbstractNoaaIngestionOrchestrator {
 
             // Step 3: Process through speed layer (generic enrichment + S3 upload)
             weatherData = speedLayerProcessor.processWeatherData(weatherData);
-            weatherData.addMetadata("ingestion_duration_ms",
-                    Duration.between(startTime, Instant.now()).toMillis());
+
+            Duration duration = Duration.between(startTime, Instant.now());
+            weatherData.addMetadata("ingestion_duration_ms", duration.toMillis());
 
             metrics.incrementUploadSuccesses();
 
-            Duration duration = Duration.between(startTime, Instant.now());
             logger.info("Successfully ingested {} for {} in {}ms",
                     dataType, stationId, duration.toMillis());
 
@@ -206,19 +206,7 @@ public class NoaaAviationWeatherClient {
             }
         }
 
-        List<WeatherData> results = new ArrayList<>();
-
-        for (String stationId : stationIds) {
-            try {
-                WeatherData data = fetchMetarReport(stationId);
-                if (data != null) {
-                    results.add(data);
-                }
-            } catch (WeatherServiceException e) {
-                // Log error but continue with other stations
-                logger.error("Failed to fetch METAR for {}: {}", stationId, e.getMessage());
-            }
-        }
+        List<WeatherData> results = fetchReports(stationIds, this::fetchMetarReport, "METAR");
 
         logger.info("Fetched {} METAR reports out of {} stations",
                 results.size(), stationIds.length);
@@ -299,26 +287,59 @@ public class NoaaAviationWeatherClient {
             }
         }
 
-        List<WeatherData> results = new ArrayList<>();
+        List<WeatherData> results = fetchReports(stationIds, this::fetchTafReport, "TAF");
+
+        logger.info("Fetched {} TAF reports out of {} stations",
+                results.size(), stationIds.length);
+
+        return results;
+    }
+
+    /**
+     * Fetches one report per station, in input order, skipping stations with no data.
+     * <p>
+     * Stations are fetched one after another; concurrency across stations is
+     * the ingestion orchestrator's job (see {@code maxConcurrentFetches}).
+     *
+     * @param stationIds validated ICAO station identifiers
+     * @param fetcher single-station fetch (METAR or TAF)
+     * @param reportType report type name for logging
+     * @return fetched reports in the same order as the station IDs
+     */
+    private List<WeatherData> fetchReports(String[] stationIds, ReportFetcher fetcher, String reportType) {
+        List<WeatherData> results = new ArrayList<>(stationIds.length);
 
         for (String stationId : stationIds) {
-            try {
-                WeatherData data = fetchTafReport(stationId);
-                if (data != null) {
-                    results.add(data);
-                }
-            } catch (WeatherServiceException e) {
-                // Log error but continue with other stations
-                logger.error("Failed to fetch TAF for {}: {}", stationId, e.getMessage());
+            WeatherData data = fetchOrSkip(fetcher, stationId, reportType);
+            if (data != null) {
+                results.add(data);
             }
         }
 
-        logger.info("Fetched {} TAF reports out of {} stations",
-                results.size(), stationIds.length);
-
         return results;
     }
 
+    /**
+     * Fetches a single report, logging and returning null on failure.
+     */
+    private WeatherData fetchOrSkip(ReportFetcher fetcher, String stationId, String reportType) {
+        try {
+            return fetcher.fetch(stationId);
+        } catch (WeatherServiceException e) {
+            // Log error but continue with other stations
+            logger.error("Failed to fetch {} for {}: {}", reportType, stationId, e.getMessage());
+            return null;
+        }
+    }
+
+    /**
+     * Single-station fetch used by the multi-station methods.
+     */
+    @FunctionalInterface
+    private interface ReportFetcher {
+        WeatherData fetch(String stationId) throws WeatherServiceException;
+    }
+
     /**
      * Alias for fetchMetarReport for backward compatibility.
      *
@@ -433,10 +454,11 @@ public class NoaaAviationWeatherClient {
             metarLine = rawText.replace("\n", " ").trim();
         }
 
-        // Create WeatherData object
+        // Create WeatherData object; one clock read serves both timestamps
+        Instant fetchTime = Instant.now();
         NoaaWeatherData data = new NoaaWeatherData(
                 stationId.toUpperCase(),
-                Instant.now(),
+                fetchTime,
                 "METAR"
         );
 
@@ -445,7 +467,7 @@ public class NoaaAviationWeatherClient {
         data.setProcessingLayer(ProcessingLayer.SPEED_LAYER);
         data.addMetadata("format", "TEXT");
         data.addMetadata("full_response", rawText);
-        data.addMetadata("fetch_timestamp", Instant.now().toString());
+        data.addMetadata("fetch_timestamp", fetchTime.toString());
 
         logger.debug("Parsed METAR for {}: {}", stationId, metarLine);
 
@@ -490,10 +512,11 @@ public class NoaaAviationWeatherClient {
             tafText = rawText.replace("\n", " ").trim();
         }
 
-        // Create WeatherData object
+        // Create WeatherData object; one clock read serves both timestamps
+        Instant fetchTime = Instant.now();
         NoaaWeatherData data = new NoaaWeatherData(
                 stationId.toUpperCase(),
-                Instant.now(),
+                fetchTime,
                 "TAF"
         );
 
@@ -502,7 +525,7 @@ public class NoaaAviationWeatherClient {
         data.setProcessingLayer(ProcessingLayer.SPEED_LAYER);
         data.addMetadata("format", "TEXT");
         data.addMetadata("full_response", rawText);
-        data.addMetadata("fetch_timestamp", Instant.now().toString());
+        data.addMetadata("fetch_timestamp", fetchTime.toString());
 
         logger.debug("Parsed TAF for {}: {}", stationId, tafText);
 
@@ -467,6 +467,31 @@ class AbstractNoaaIngestionOrchestratorTest {
         assertTrue(result.getFailures().isEmpty());
     }
 
+    @Test
+    void testIngestionResult_ReturnsSnapshotCopies() {
+        // Arrange
+        AbstractNoaaIngestionOrchestrator.IngestionResult result =
+                new AbstractNoaaIngestionOrchestrator.IngestionResult();
+        WeatherData data = createMockWeatherData("KJFK");
+        result.addSuccess("KJFK", data);
+        result.addFailure("INVALID",
+                new WeatherServiceException(ErrorType.INVALID_STATION_CODE, "Invalid"));
+
+        // Assert
+        assertEquals(List.of("KJFK"), result.getSuccessfulStations());
+        assertEquals(List.of(data), result.getSuccessfulData());
+        assertTrue(result.getFailures().containsKey("INVALID"));
+
+        // Changes to a returned collection do not reach the result
+        result.getSuccessfulStations().add("KLAX");
+        result.getSuccessfulData().clear();
+        result.getFailures().remove("INVALID");
+
+        assertEquals(List.of("KJFK"), result.getSuccessfulStations());
+        assertEquals(List.of(data), result.getSuccessfulData());
+        assertEquals(1, result.getFailureCount());
+    }
+
     @Test
     void testIngestionResult_ToString() {
         // Arrange
@@ -28,11 +28,18 @@ import org.junit.jupiter.api.BeforeEach;
 import org.junit.jupiter.api.Test;
 
 import java.net.http.HttpClient;
+import java.net.http.HttpRequest;
+import java.net.http.HttpResponse;
+import java.util.HashMap;
 import java.util.List;
+import java.util.Map;
 import java.util.Properties;
 
 import static com.github.tomakehurst.wiremock.client.WireMock.*;
 import static org.junit.jupiter.api.Assertions.*;
+import static org.mockito.ArgumentMatchers.any;
+import static org.mockito.Mockito.mock;
+import static org.mockito.Mockito.when;
 
 /**
  * Unit tests for NoaaAviationWeatherClient using WireMock.
@@ -238,6 +245,60 @@ class NoaaAviationWeatherClientTest {
         assertEquals("KJFK", results.get(0).getStationId());
     }
 
+    @Test
+    void testFetchMetarReports_ManyStationsKeepInputOrder() throws WeatherServiceException {
+        String[] stations = {"KJFK", "KLGA", "KEWR", "KBOS", "KPHL", "KDCA"};
+        for (String station : stations) {
+            stubFor(get(urlEqualTo("/metar/stations/" + station + ".TXT"))
+                    .willReturn(aResponse()
+                            .withStatus(200)
+                            .withBody("2025/01/11 14:56\n" + station + " 111456Z")));
+        }
+        // One station without data is skipped
+        stubFor(get(urlEqualTo("/metar/stations/KBOS.TXT"))
+                .willReturn(aResponse()
+                        .withStatus(404)));
+
+        List<WeatherData> results = client.fetchMetarReports(stations);
+
+        assertEquals(List.of("KJFK", "KLGA", "KEWR", "KPHL", "KDCA"),
+                results.stream().map(WeatherData::getStationId).toList());
+    }
+
+    @Test
+    @SuppressWarnings("unchecked")
+    void testFetchMetarReports_UnexpectedFailurePropagates() throws Exception {
+        String[] stations = {"KJFK", "KLGA", "KEWR", "KBOS", "KPHL", "KDCA"};
+        Map<String, HttpResponse<String>> responses = new HashMap<>();
+        for (String station : stations) {
+            HttpResponse<String> response = mock(HttpResponse.class);
+            when(response.statusCode()).thenReturn(200);
+            when(response.body()).thenReturn("2025/01/11 14:56\n" + station + " 111456Z");
+            responses.put(station + ".TXT", response);
+        }
+
+        // Only WeatherServiceException skips a station; anything else aborts the batch
+        HttpClient httpClient = mock(HttpClient.class);
+        when(httpClient.send(any(HttpRequest.class), any(HttpResponse.BodyHandler.class)))
+                .thenAnswer(invocation -> {
+                    String path = invocation.<HttpRequest>getArgument(0).uri().getPath();
+                    if (path.endsWith("KEWR.TXT")) {
+                        throw new IllegalStateException("unexpected failure");
+                    }
+                    return responses.get(path.substring(path.lastIndexOf('/') + 1));
+                });
+
+        NoaaAviationWeatherClient mockedClient = new NoaaAviationWeatherClient(httpClient, testConfig);
+        try {
+            IllegalStateException exception = assertThrows(IllegalStateException.class,
+                    () -> mockedClient.fetchMetarReports(stations));
+
+            assertEquals("unexpected failure", exception.getMessage());
+        } finally {
+            mockedClient.close();
+        }
+    }
+
     @Test
     void testFetchMetarReports_NullStationIds() {
         WeatherServiceException exception = assertThrows(WeatherServiceException.class,
@@ -326,7 +326,7 @@ public abstract class NoaaAviationWeatherParser<T extends NoaaWeatherData>
         String numStr = distStr.replaceFirst(RVR_PREFIX_PATTERN, "");
 
         try {
-            double distance = Double.parseDouble(numStr);
+            double distance = parseDistanceNumber(numStr);
             Visibility visibility = new Visibility(distance, "M", lessThan, greaterThan, null);
             conditionsBuilder.visibility(visibility);
 
@@ -390,7 +390,7 @@ public abstract class NoaaAviationWeatherParser<T extends NoaaWeatherData>
         // Handle mixed fractions: "1 1/2" → 1.5
         if (distStr.contains(" ")) {
             String[] parts = distStr.split("\\s+");
-            double whole = Double.parseDouble(parts[0]);
+            double whole = parseDistanceNumber(parts[0]);
             double fraction = parseFraction(parts[1]);
             return whole + fraction;
         }
@@ -401,7 +401,7 @@ public abstract class NoaaAviationWeatherParser<T extends NoaaWeatherData>
         }
 
         // Handle whole numbers: "10" → 10.0
-        return Double.parseDouble(distStr);
+        return parseDistanceNumber(distStr);
     }
 
     /**
@@ -412,11 +412,39 @@ public abstract class NoaaAviationWeatherParser<T extends NoaaWeatherData>
      */
     protected double parseFraction(String fraction) {
         String[] parts = fraction.split("/");
-        double numerator = Double.parseDouble(parts[0]);
-        double denominator = Double.parseDouble(parts[1]);
+        double numerator = parseDistanceNumber(parts[0]);
+        double denominator = parseDistanceNumber(parts[1]);
         return numerator / denominator;
     }
 
+    /**
+     * Parse a numeric distance component.
+     * <p>
+     * Visibility values are almost always plain digit runs ("10", "9999", the
+     * parts of "1 1/2"), so those are accumulated directly as an integer;
+     * only anything else goes through the general Double.parseDouble path.
+     *
+     * @param value Numeric string (e.g., "10", "9999", "1.5")
+     * @return Parsed value
+     * @throws NumberFormatException if the value is not a valid number
+     */
+    static double parseDistanceNumber(String value) {
+        int length = value.length();
+        if (length == 0 || length > 9) {
+            return Double.parseDouble(value);
+        }
+
+        int result = 0;
+        for (int i = 0; i < length; i++) {
+            int digit = value.charAt(i) - '0';
+            if (digit < 0 || digit > 9) {
+                return Double.parseDouble(value);
+            }
+            result = result * 10 + digit;
+        }
+        return result;
+    }
+
     /**
      * Handle present weather phenomena.
      * Parses weather codes like: -RA, +TSRA, VCFG, BR, NSW
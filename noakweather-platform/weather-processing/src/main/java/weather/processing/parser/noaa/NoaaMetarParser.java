@@ -30,6 +30,7 @@ import java.time.LocalDateTime;
 import java.time.ZoneOffset;
 import java.util.Map;
 import java.util.Objects;
+import java.util.Set;
 import java.util.regex.Matcher;
 import java.util.regex.Pattern;
 
@@ -70,15 +71,25 @@ public class NoaaMetarParser extends NoaaAviationWeatherParser<NoaaMetarData> {
     private static final String GROUP_PRESSURE_CHANGE = "press";
     private static final String GROUP_HEIGHT_CODE = "height";
 
-    // Pattern registry for METAR parsing
-    private final NoaaAviationWeatherPatternRegistry patternRegistry;
+    // Automated station type remark (AO1/AO2, tolerating the A01/A02 OCR variant).
+    // Unlike AUTO_PATTERN this also matches at the very end of the remarks.
+    private static final Pattern AUTOMATED_STATION_REMARK_PATTERN = Pattern.compile("^A[O0](?<type>\\d)\\s*");
+
+    // "Other" weather phenomena kept in a weather event code
+    private static final Set<String> OTHER_PHENOMENA_CODES = Set.of("PO", "SQ", "FC", "SS", "DS", "NSW");
+
+    // Handler tables for METAR parsing, built once per parser instead of on every parse
+    private final IndexedLinkedHashMap<Pattern, NoaaAviationWeatherPatternHandler> mainHandlers;
+    private final IndexedLinkedHashMap<Pattern, NoaaAviationWeatherPatternHandler> remarkHandlers;
 
     // METAR-specific state
     private Instant issueTime;
     private String reportType;
 
     public NoaaMetarParser() {
-        this.patternRegistry = new NoaaAviationWeatherPatternRegistry();
+        NoaaAviationWeatherPatternRegistry patternRegistry = new NoaaAviationWeatherPatternRegistry();
+        this.mainHandlers = patternRegistry.getMainHandlers();
+        this.remarkHandlers = patternRegistry.getRemarksHandlers();
     }
 
     @Override
@@ -141,7 +152,7 @@ public class NoaaMetarParser extends NoaaAviationWeatherParser<NoaaMetarData> {
      * @return array with [mainBody, remarks]
      */
     private String[] splitMainBodyAndRemarks(String token) {
-        String[] parts = token.split("\\s+RMK\\s+", 2);
+        String[] parts = METAR_REMARKS_SEPARATOR.split(token, 2);
         String mainBody = parts[0];
         String remarks = parts.length > 1 ? parts[1] : "";
         return new String[]{mainBody, remarks};
@@ -154,8 +165,6 @@ public class NoaaMetarParser extends NoaaAviationWeatherParser<NoaaMetarData> {
      * @return remaining unparsed tokens
      */
     private String parseMainBody(String mainBody) {
-        IndexedLinkedHashMap<Pattern, NoaaAviationWeatherPatternHandler> mainHandlers =
-                patternRegistry.getMainHandlers();
         return parseWithHandlers(mainBody, mainHandlers, "MAIN");
     }
 
@@ -171,9 +180,6 @@ public class NoaaMetarParser extends NoaaAviationWeatherParser<NoaaMetarData> {
         }
 
         String originalRemarks = remarks;
-        IndexedLinkedHashMap<Pattern, NoaaAviationWeatherPatternHandler> remarkHandlers =
-                patternRegistry.getRemarksHandlers();
-
         remarks = parseWithHandlers(remarks, remarkHandlers, "REMARK");
 
         // Also do sequential parsing of remarks for components not in registry
@@ -212,12 +218,12 @@ public class NoaaMetarParser extends NoaaAviationWeatherParser<NoaaMetarData> {
         String trimmed = rawData.trim();
 
         // Check if starts with date/time pattern (YYYY/MM/DD HH:MM format)
-        if (trimmed.matches("^\\d{4}/\\d{2}/\\d{2}\\s+.*")) {
+        if (METAR_WITH_DATE_PREFIX.matcher(trimmed).matches()) {
             return true;
         }
 
         // Check if METAR or SPECI appears at the start (not just anywhere)
-        return trimmed.matches("^\\s*(METAR|SPECI)\\s+.*");
+        return METAR_KEYWORD_START.matcher(trimmed).matches();
     }
 
     @Override
@@ -752,33 +758,26 @@ public class NoaaMetarParser extends NoaaAviationWeatherParser<NoaaMetarData> {
      * - M prefix for negative (e.g., "M05" → -5.0)
      * - Hyphen prefix for negative (e.g., "-05" → -5.0)
      * - Missing indicators (//, XX, MM) → null
-     * - Null or blank → null
+     * <p>
+     * TEMP_DEWPOINT_PATTERN is the validation boundary: the digit groups are
+     * only captured as {@code \d+}, and the missing indicators leave them
+     * null, so no per-value format handling is needed here. Anything
+     * unexpected still surfaces through handleTempDewpoint's catch.
      *
      * @param sign the sign indicator ("M", "-", or null)
      * @param digits the temperature digits (e.g., "05", "22")
      * @return temperature in Celsius, or null if missing/unknown
      */
     private Double parseTemperatureValue(String sign, String digits) {
-        // Handle missing/unknown values
-        if (digits == null || digits.isBlank() ||
-                "//".equals(digits) || "XX".equals(digits) || "MM".equals(digits)) {
+        // Missing/unknown values (//, XX, MM) do not capture digits
+        if (digits == null) {
             return null;
         }
 
-        try {
-            double value = Double.parseDouble(digits);
-
-            // Apply negative sign if present
-            if ("M".equals(sign) || "-".equals(sign)) {
-                value = -value;
-            }
-
-            return value;
+        double value = Integer.parseInt(digits);
 
-        } catch (NumberFormatException e) {
-            LOGGER.warn("Invalid temperature format: {}", digits);
-            return null;
-        }
+        // Apply negative sign if present
+        return "M".equals(sign) || "-".equals(sign) ? -value : value;
     }
 
     /**
@@ -1063,9 +1062,7 @@ public class NoaaMetarParser extends NoaaAviationWeatherParser<NoaaMetarData> {
      * @return the remaining text after this remark is processed
      */
     private String handleAutomatedStationType(String remarksText, NoaaMetarRemarks.Builder remarks) {
-        // Use the AUTO_PATTERN from the registry
-        Pattern autoPattern = Pattern.compile("^A[O0](?<type>\\d)\\s*");
-        Matcher matcher = autoPattern.matcher(remarksText);
+        Matcher matcher = AUTOMATED_STATION_REMARK_PATTERN.matcher(remarksText);
 
         if (!matcher.find()) {
             return remarksText;
@@ -1305,10 +1302,12 @@ public class NoaaMetarParser extends NoaaAviationWeatherParser<NoaaMetarData> {
             PeakWind peakWind = new PeakWind(direction, speed, hour, minute);
             remarks.peakWind(peakWind);
 
-            LOGGER.debug("Peak wind: dir={}°, speed={}kt, time={}:{}",
-                    direction, speed,
-                    hour != null ? String.format("%02d", hour) : "XX",
-                    minute != null ? String.format("%02d", minute) : "XX");
+            if (LOGGER.isDebugEnabled()) {
+                LOGGER.debug("Peak wind: dir={}°, speed={}kt, time={}:{}",
+                        direction, speed,
+                        hour != null ? String.format("%02d", hour) : "XX",
+                        minute != null ? String.format("%02d", minute) : "XX");
+            }
 
             return remarksText.substring(matcher.end()).trim();
 
@@ -1371,10 +1370,12 @@ public class NoaaMetarParser extends NoaaAviationWeatherParser<NoaaMetarData> {
             WindShift windShift = new WindShift(hour, minute, frontalPassage);
             remarks.windShift(windShift);
 
-            LOGGER.debug("Wind shift: time={}:{}, frontal passage={}",
-                    hour != null ? String.format("%02d", hour) : "XX",
-                    minute != null ? String.format("%02d", minute) : "XX",
-                    frontalPassage);
+            if (LOGGER.isDebugEnabled()) {
+                LOGGER.debug("Wind shift: time={}:{}, frontal passage={}",
+                        hour != null ? String.format("%02d", hour) : "XX",
+                        minute != null ? String.format("%02d", minute) : "XX",
+                        frontalPassage);
+            }
 
             return remarksText.substring(matcher.end()).trim();
 
@@ -1664,8 +1665,11 @@ public class NoaaMetarParser extends NoaaAviationWeatherParser<NoaaMetarData> {
             PrecipitationAmount precip = PrecipitationAmount.fromEncoded(precipStr, 1);
             remarks.hourlyPrecipitation(precip);
 
-            LOGGER.debug("Hourly precipitation: {}",
-                    precip.isTrace() ? "trace" : String.format("%.2f inches", precip.inches()));
+            // Guarded: the argument is formatted eagerly on every remarks pass
+            if (LOGGER.isDebugEnabled()) {
+                LOGGER.debug("Hourly precipitation: {}",
+                        precip.isTrace() ? "trace" : String.format("%.2f inches", precip.inches()));
+            }
 
             return remarksText.substring(matcher.end()).trim();
 
@@ -1865,6 +1869,13 @@ public class NoaaMetarParser extends NoaaAviationWeatherParser<NoaaMetarData> {
         return remaining;
     }
 
+    /**
+     * Check for a single-character intensity sign ("-" light, "+" heavy).
+     */
+    private static boolean isIntensitySign(String value) {
+        return "-".equals(value) || "+".equals(value);
+    }
+
     /**
      * Parse a single weather event from the existing BEGIN_END_WEATHER_PATTERN matcher.
      *
@@ -1885,9 +1896,9 @@ public class NoaaMetarParser extends NoaaAviationWeatherParser<NoaaMetarData> {
         String intensityStart = matcher.group("int");
         String intensity = null;
 
-        if (intensityEnd != null && intensityEnd.matches("[-+]")) {
+        if (isIntensitySign(intensityEnd)) {
             intensity = intensityEnd;
-        } else if (intensityStart != null && intensityStart.matches("[-+]")) {
+        } else if (isIntensitySign(intensityStart)) {
             intensity = intensityStart;
         }
 
@@ -2034,7 +2045,7 @@ public class NoaaMetarParser extends NoaaAviationWeatherParser<NoaaMetarData> {
             code.append(obscuration);
         }
 
-        if (other != null && !other.isEmpty() && !other.equals("/") && other.matches("PO|SQ|FC|SS|DS|NSW")) {
+        if (other != null && OTHER_PHENOMENA_CODES.contains(other)) {
             code.append(other);
         }
 
@@ -71,12 +71,15 @@ public class NoaaTafParser extends NoaaAviationWeatherParser<NoaaTafData> {
 
     private static final Logger LOGGER = LoggerFactory.getLogger(NoaaTafParser.class);
 
-    // Pattern registry for METAR-like weather elements
-    private final NoaaAviationWeatherPatternRegistry patternRegistry;
+    // Handlers for METAR-like weather elements, built once per parser
+    // (the registry assembles a new map on every call and every forecast group needs it)
+    private final IndexedLinkedHashMap<Pattern, NoaaAviationWeatherPatternHandler> mainHandlers;
 
     // TAF-specific state
     private Instant issueTime;
     private LocalDateTime issueDateTime;
+    // issueTime as UTC date-time, kept alongside it so DDHH lookups don't re-derive it per group
+    private LocalDateTime issueReferenceTime;
     private ValidityPeriod validityPeriod;
 
     // Current forecast period being built
@@ -87,7 +90,7 @@ public class NoaaTafParser extends NoaaAviationWeatherParser<NoaaTafData> {
     private Integer currentProbability;
 
     public NoaaTafParser() {
-        this.patternRegistry = new NoaaAviationWeatherPatternRegistry();
+        this.mainHandlers = new NoaaAviationWeatherPatternRegistry().getMainHandlers();
     }
 
     @Override
@@ -175,6 +178,7 @@ public class NoaaTafParser extends NoaaAviationWeatherParser<NoaaTafData> {
         this.weatherData = new NoaaTafData();
         this.issueTime = null;
         this.issueDateTime = null;
+        this.issueReferenceTime = null;
         this.validityPeriod = null;
         resetCurrentPeriod();
     }
@@ -252,6 +256,7 @@ public class NoaaTafParser extends NoaaAviationWeatherParser<NoaaTafData> {
 
             this.issueDateTime = LocalDateTime.of(year, month, day, hour, minute);
             this.issueTime = issueDateTime.toInstant(ZoneOffset.UTC);
+            this.issueReferenceTime = issueDateTime;
 
             LOGGER.debug("Parsed external issue time: {}", issueTime);
 
@@ -323,6 +328,7 @@ public class NoaaTafParser extends NoaaAviationWeatherParser<NoaaTafData> {
 
         LocalDateTime issueLocalDateTime = LocalDateTime.of(year, month, day, hour, minute);
         this.issueTime = issueLocalDateTime.toInstant(ZoneOffset.UTC);
+        this.issueReferenceTime = issueLocalDateTime;
 
         weatherData.setStationId(stationId);
         weatherData.setIssueTime(issueTime);
@@ -357,6 +363,14 @@ public class NoaaTafParser extends NoaaAviationWeatherParser<NoaaTafData> {
         return token.substring(matcher.end()).trim();
     }
 
+    /**
+     * Reference date-time used to resolve year and month for DDHH/DDHHmm groups:
+     * the issue time if known, otherwise the current UTC time.
+     */
+    private LocalDateTime getReferenceTime() {
+        return issueReferenceTime != null ? issueReferenceTime : LocalDateTime.now(ZoneOffset.UTC);
+    }
+
     /**
      * Parse a validity time in DDHH format.
      */
@@ -365,9 +379,7 @@ public class NoaaTafParser extends NoaaAviationWeatherParser<NoaaTafData> {
         int hour = Integer.parseInt(timeStr.substring(2, 4));
 
         // Use issue time to determine year and month
-        LocalDateTime referenceTime = issueTime != null ?
-                LocalDateTime.ofInstant(issueTime, ZoneOffset.UTC) :
-                LocalDateTime.now(ZoneOffset.UTC);
+        LocalDateTime referenceTime = getReferenceTime();
 
         int year = referenceTime.getYear();
         int month = referenceTime.getMonthValue();
@@ -497,9 +509,7 @@ public class NoaaTafParser extends NoaaAviationWeatherParser<NoaaTafData> {
         int hour = Integer.parseInt(timeStr.substring(2, 4));
         int minute = Integer.parseInt(timeStr.substring(4, 6));
 
-        LocalDateTime referenceTime = issueTime != null ?
-                LocalDateTime.ofInstant(issueTime, ZoneOffset.UTC) :
-                LocalDateTime.now(ZoneOffset.UTC);
+        LocalDateTime referenceTime = getReferenceTime();
 
         int year = referenceTime.getYear();
         int month = referenceTime.getMonthValue();
@@ -617,9 +627,6 @@ public class NoaaTafParser extends NoaaAviationWeatherParser<NoaaTafData> {
      * Stops when stopCondition is met.
      */
     private String parseWeatherConditions(String token, java.util.function.Predicate<String> stopCondition) {
-        IndexedLinkedHashMap<Pattern, NoaaAviationWeatherPatternHandler> mainHandlers =
-                patternRegistry.getMainHandlers();
-
         return parseWithHandlers(token, mainHandlers, stopCondition);
     }
 
@@ -822,9 +829,7 @@ public class NoaaTafParser extends NoaaAviationWeatherParser<NoaaTafData> {
      * Parse temperature forecast time in DDHH format.
      */
     private Instant parseTemperatureForecastTime(int day, int hour) {
-        LocalDateTime referenceTime = issueTime != null ?
-                LocalDateTime.ofInstant(issueTime, ZoneOffset.UTC) :
-                LocalDateTime.now(ZoneOffset.UTC);
+        LocalDateTime referenceTime = getReferenceTime();
 
         int year = referenceTime.getYear();
         int month = referenceTime.getMonthValue();
@@ -856,7 +861,7 @@ public class NoaaTafParser extends NoaaAviationWeatherParser<NoaaTafData> {
             throw new IllegalStateException("Could not extract validity period from TAF");
         }
 
-        if (weatherData.getForecastPeriods().isEmpty()) {
+        if (weatherData.getForecastPeriodCount() == 0) {
             LOGGER.warn("No forecast periods parsed from TAF");
         }
     }
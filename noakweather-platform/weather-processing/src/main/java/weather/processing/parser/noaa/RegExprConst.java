@@ -588,6 +588,30 @@ public final class RegExprConst {
             "^\\s*TAF\\s+"
     );
 
+    /**
+     * Pattern for METAR report with date prefix (full-string match)
+     * Example: "2025/01/11 14:56 KCLT 111456Z ..."
+     */
+    public static final Pattern METAR_WITH_DATE_PREFIX = Pattern.compile(
+            "^\\d{4}/\\d{2}/\\d{2}\\s+.*"
+    );
+
+    /**
+     * Pattern for METAR/SPECI report starting with its keyword (full-string match)
+     * Example: "METAR KJFK 151851Z ..."
+     */
+    public static final Pattern METAR_KEYWORD_START = Pattern.compile(
+            "^\\s*(METAR|SPECI)\\s+.*"
+    );
+
+    /**
+     * Pattern for splitting METAR main body and remarks section
+     * Matches RMK with whitespace on both sides, consuming it
+     */
+    public static final Pattern METAR_REMARKS_SEPARATOR = Pattern.compile(
+            "\\s+RMK\\s+"
+    );
+
     /**
      * Pattern for splitting TAF main body and remarks section
      * Matches RMK with at least one space on each side
@@ -22,7 +22,9 @@ import weather.processing.parser.common.WeatherParser;
 import weather.processing.parser.common.ParseResult;
 import weather.processing.parser.noaa.NoaaMetarParser;
 
+import java.util.ArrayList;
 import java.util.HashMap;
+import java.util.List;
 import java.util.Map;
 import java.util.Set;
 
@@ -90,6 +92,50 @@ public class UniversalWeatherParserService {
         return parser.parse(rawData);
     }
     
+    /**
+     * Parse a batch of reports from a single known source.
+     * Use this for bulk ingest instead of calling {@link #parse} in a loop.
+     * 
+     * Reports of the same type are handed to the same parser back to back, and
+     * the result list is sized once up front. A failed report does not stop the
+     * batch - its failure is returned in the same position as its input.
+     * 
+     * @param rawReports The raw weather data strings
+     * @param source The known source of the data (NOAA, OpenWeatherMap, etc.)
+     * @return ParseResults in the same order as the input reports
+     */
+    public List<ParseResult<? extends WeatherData>> parseBatch(List<String> rawReports, WeatherDataSource source) {
+        if (rawReports == null) {
+            throw new IllegalArgumentException("Raw reports cannot be null");
+        }
+        
+        List<ParseResult<? extends WeatherData>> results = new ArrayList<>(rawReports.size());
+        String lastParserType = null;
+        WeatherParser<? extends WeatherData> parser = null;
+        
+        for (String rawData : rawReports) {
+            if (rawData == null || rawData.trim().isEmpty()) {
+                results.add(ParseResult.failure("Raw data cannot be null or empty"));
+                continue;
+            }
+            
+            String parserType = mapSourceToParserType(rawData, source);
+            if (!parserType.equals(lastParserType)) {
+                parser = parsers.get(parserType);
+                lastParserType = parserType;
+            }
+            
+            if (parser == null) {
+                results.add(ParseResult.failure(
+                        "No parser registered for source: " + source + " (parser type: " + parserType + ")"));
+            } else {
+                results.add(parser.parse(rawData));
+            }
+        }
+        
+        return results;
+    }
+    
     /**
      * Auto-detect and parse weather data.
      * Use this when you don't know the source/format.
@@ -154,9 +200,10 @@ public class UniversalWeatherParserService {
     private String mapSourceToParserType(String rawData, WeatherDataSource source) {
         if (source == WeatherDataSource.NOAA) {
             // NOAA can have multiple report types - determine which one
-            if (rawData.trim().startsWith("METAR")) {
+            String trimmed = rawData.trim();
+            if (trimmed.startsWith("METAR")) {
                 return "NOAA_METAR";
-            } else if (rawData.trim().startsWith("TAF")) {
+            } else if (trimmed.startsWith("TAF")) {
                 return "NOAA_TAF";
             }
             // Default to METAR for NOAA
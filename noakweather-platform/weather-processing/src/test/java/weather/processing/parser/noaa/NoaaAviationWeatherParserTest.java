@@ -314,6 +314,22 @@ class NoaaAviationWeatherParserTest {
             double result = parser.parseFraction("3/4");
             assertThat(result).isEqualTo(0.75);
         }
+
+        @ParameterizedTest
+        @ValueSource(strings = {"0", "10", "0800", "9999", "123456789", "1234567890", "1.5", " 10", "+5"})
+        @DisplayName("parseDistanceNumber should agree with Double.parseDouble")
+        void testParseDistanceNumber(String input) {
+            assertThat(NoaaAviationWeatherParser.parseDistanceNumber(input))
+                    .isEqualTo(Double.parseDouble(input));
+        }
+
+        @ParameterizedTest
+        @ValueSource(strings = {"", "1O", "abc"})
+        @DisplayName("parseDistanceNumber should reject non-numeric values")
+        void testParseDistanceNumber_Invalid(String input) {
+            assertThatThrownBy(() -> NoaaAviationWeatherParser.parseDistanceNumber(input))
+                    .isInstanceOf(NumberFormatException.class);
+        }
     }
 
     // ==================== PRESENT WEATHER TESTS ====================
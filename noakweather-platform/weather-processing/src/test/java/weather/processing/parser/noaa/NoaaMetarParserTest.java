@@ -1495,6 +1495,15 @@ class NoaaMetarParserTest {
         assertNull(data.getTemperature().dewpointCelsius());
     }
 
+    @Test
+    @DisplayName("Should keep M00 as negative zero")
+    void testParseTemperatureNegativeZero() {
+        NoaaMetarData data = extractMetarData(parser.parse("METAR KJFK 251651Z 19005KT 10SM 00/M00 A3015"));
+
+        assertEquals(0.0, data.getTemperature().celsius());
+        assertEquals(-0.0, data.getTemperature().dewpointCelsius());
+    }
+
     @Test
     @DisplayName("Should use Temperature query methods")
     void testTemperatureQueryMethods() {
@@ -25,6 +25,8 @@ import weather.model.WeatherDataSource;
 import weather.processing.parser.common.ParseResult;
 import weather.processing.parser.common.WeatherParser;
 
+import java.util.Arrays;
+import java.util.List;
 import java.util.Set;
 
 import static org.junit.jupiter.api.Assertions.*;
@@ -385,4 +387,43 @@ class UniversalWeatherParserServiceTest {
         assertTrue(result.isFailure());
         assertEquals("Custom parse attempted", result.getErrorMessage());
     }
+    
+    @Test
+    @DisplayName("Should parse a batch of reports preserving input order")
+    void testParseBatch() {
+        List<String> reports = Arrays.asList(
+                "METAR KJFK 251651Z 28016KT 10SM FEW250 22/12 A3015",
+                "",
+                "METAR KLAX 251651Z 28016KT 10SM"
+        );
+        
+        List<ParseResult<? extends WeatherData>> results = service.parseBatch(reports, WeatherDataSource.NOAA);
+        
+        assertEquals(3, results.size());
+        assertTrue(results.get(0).isSuccess());
+        assertEquals("KJFK", ((NoaaWeatherData) results.get(0).getData().get()).getStationId());
+        assertTrue(results.get(1).isFailure());
+        assertTrue(results.get(2).isSuccess());
+        assertEquals("KLAX", ((NoaaWeatherData) results.get(2).getData().get()).getStationId());
+    }
+    
+    @Test
+    @DisplayName("Should report unregistered source for every report in a batch")
+    void testParseBatchUnregisteredSource() {
+        List<ParseResult<? extends WeatherData>> results =
+                service.parseBatch(List.of("SOME DATA", "MORE DATA"), WeatherDataSource.UNKNOWN);
+        
+        assertEquals(2, results.size());
+        results.forEach(result -> {
+            assertTrue(result.isFailure());
+            assertTrue(result.getErrorMessage().contains("No parser registered"));
+        });
+    }
+    
+    @Test
+    @DisplayName("Should reject null batch")
+    void testParseBatchNull() {
+        assertThrows(IllegalArgumentException.class,
+                () -> service.parseBatch(null, WeatherDataSource.NOAA));
+    }
 }
@@ -21,6 +21,7 @@ import com.fasterxml.jackson.databind.DeserializationFeature;
 import com.fasterxml.jackson.annotation.JsonAutoDetect;
 import com.fasterxml.jackson.annotation.PropertyAccessor;
 import com.fasterxml.jackson.databind.ObjectMapper;
+import com.fasterxml.jackson.databind.ObjectReader;
 import com.fasterxml.jackson.datatype.jsr310.JavaTimeModule;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
@@ -29,6 +30,8 @@ import weather.model.WeatherData;
 import weather.storage.exception.WeatherDataMappingException;
 
 import java.time.Instant;
+import java.time.ZoneOffset;
+import java.time.format.DateTimeFormatter;
 import java.util.HashMap;
 import java.util.Map;
 
@@ -60,6 +63,12 @@ public class DynamoDbMapper {
 
     private final ObjectMapper objectMapper;
 
+    /**
+     * Reader bound to the polymorphic WeatherData root type once, so each item
+     * read skips the per-call type construction of objectMapper.readValue()
+     */
+    private final ObjectReader weatherDataReader;
+
     /**
      * Attribute name for the JSON representation of the weather data
      */
@@ -93,6 +102,12 @@ public class DynamoDbMapper {
      */
     private static final String ATTR_TIME_BUCKET = "time_bucket";
 
+    /**
+     * Formatter for time bucket values, built once (formatters are immutable and thread-safe)
+     */
+    private static final DateTimeFormatter TIME_BUCKET_FORMAT =
+            DateTimeFormatter.ofPattern("yyyy-MM-dd-HH").withZone(ZoneOffset.UTC);
+
     public DynamoDbMapper() {
         this.objectMapper = new ObjectMapper();
         // CRITICAL: Register JavaTimeModule to handle Instant serialization
@@ -102,6 +117,8 @@ public class DynamoDbMapper {
         // Don't include getters in serialization (prevents computed properties from being serialized)
         this.objectMapper.setVisibility(PropertyAccessor.ALL, JsonAutoDetect.Visibility.NONE);
         this.objectMapper.setVisibility(PropertyAccessor.FIELD, JsonAutoDetect.Visibility.ANY);
+        // Bind after configuration so the reader sees the settings above
+        this.weatherDataReader = objectMapper.readerFor(WeatherData.class);
     }
 
     /**
@@ -219,7 +236,7 @@ public class DynamoDbMapper {
             // {"dataType":"METAR",...} → Jackson sees @JsonSubTypes → Creates NoaaMetarData
             // {"dataType":"TAF",...} → Jackson sees @JsonSubTypes → Creates NoaaTafData
             // {"dataType":"NOAA",...} → Jackson sees @JsonSubTypes → Creates NoaaWeatherData
-            WeatherData weatherData = objectMapper.readValue(json, WeatherData.class);
+            WeatherData weatherData = weatherDataReader.readValue(json);
 
             logger.debug("Deserialized {} from DynamoDB attributes",
                     weatherData.getClass().getSimpleName());
@@ -296,7 +313,6 @@ public class DynamoDbMapper {
      * @return time bucket string in "YYYY-MM-DD-HH" format
      */
     private String formatTimeBucket(Instant instant) {
-        return instant.atZone(java.time.ZoneOffset.UTC)
-                .format(java.time.format.DateTimeFormatter.ofPattern("yyyy-MM-dd-HH"));
+        return TIME_BUCKET_FORMAT.format(instant);
     }
 }
@@ -28,6 +28,8 @@ import weather.storage.repository.RepositoryStats;
 import weather.storage.repository.UniversalWeatherRepository;
 
 import java.time.Instant;
+import java.time.ZoneOffset;
+import java.time.format.DateTimeFormatter;
 import java.util.*;
 
 /**
@@ -139,6 +141,12 @@ public class DynamoDbRepository implements UniversalWeatherRepository {
      */
     private static final String EXPR_TIME_RANGE = "#ot BETWEEN " + EXPR_START_TIME + EXPR_AND + EXPR_END_TIME;
 
+    /**
+     * Formatter for time bucket values, built once (formatters are immutable and thread-safe)
+     */
+    private static final DateTimeFormatter TIME_BUCKET_FORMAT =
+            DateTimeFormatter.ofPattern("yyyy-MM-dd-HH").withZone(ZoneOffset.UTC);
+
     /**
      * Creates a new DynamoDB repository with the provided client.
      *
@@ -989,8 +997,7 @@ public class DynamoDbRepository implements UniversalWeatherRepository {
      * @return time bucket string
      */
     private String formatTimeBucket(Instant instant) {
-        return instant.atZone(java.time.ZoneOffset.UTC)
-                .format(java.time.format.DateTimeFormatter.ofPattern("yyyy-MM-dd-HH"));
+        return TIME_BUCKET_FORMAT.format(instant);
     }
 
     /**